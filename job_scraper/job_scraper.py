@@ -98,10 +98,74 @@ def retry_on_exception(max_retries=3, backoff_factor=0.5, expected_exceptions=(r
         return wrapper
     return decorator
 
+def job_key(job):
+    """
+    Build the deduplication key of a job from its title, company and URL.
+    
+    Args:
+        job (dict): Job data
+        
+    Returns:
+        str: Normalized key identifying the job
+    """
+    title = job.get('title', '').lower().strip()
+    company = job.get('company', '').lower().strip()
+    
+    # Include URL in the key if available (makes deduplication less aggressive)
+    url_part = ""
+    if 'url' in job:
+        # Extract domain and path from URL to use as part of the key
+        url = job['url']
+        try:
+            parsed_url = urllib.parse.urlparse(url)
+            # Just use the domain and path, not query parameters
+            url_part = f"|{parsed_url.netloc}{parsed_url.path}"
+        except:
+            # If URL parsing fails, just use the URL as is
+            url_part = f"|{url[-30:]}"
+    
+    return f"{title}|{company}{url_part}"
+
+def load_jobs_jsonl(filename="real_estate_jobs_paris.jsonl"):
+    """
+    Load jobs from a JSON Lines archive, skipping duplicates and unreadable lines.
+    
+    Args:
+        filename (str): Name of the JSONL file to load data from
+        
+    Returns:
+        tuple: (jobs, seen_keys, stale_lines) where stale_lines counts the duplicate
+            or corrupt lines that a compaction would remove
+    """
+    jobs = []
+    seen_keys = set()
+    stale_lines = 0
+    if not os.path.exists(filename):
+        return jobs, seen_keys, stale_lines
+    
+    with open(filename, 'r', encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                job = json.loads(line)
+            except ValueError:
+                # Most likely a partially written line from an interrupted run
+                stale_lines += 1
+                continue
+            key = job_key(job)
+            if key in seen_keys:
+                stale_lines += 1
+                continue
+            seen_keys.add(key)
+            jobs.append(job)
+    return jobs, seen_keys, stale_lines
+
 class JobScraper:
     """Class to scrape job postings from various job sites."""
     
-    def __init__(self, max_pages=5, delay_min=1, delay_max=3, timeout=30, max_retries=3, max_runtime=300, date_filter=None):
+    def __init__(self, max_pages=5, delay_min=1, delay_max=3, timeout=30, max_retries=3, max_runtime=300, date_filter=None,
+                 progress_callback=None):
         """
         Initialize the scraper with settings.
         
@@ -112,6 +176,8 @@ class JobScraper:
             timeout (int): Request timeout in seconds
             max_retries (int): Maximum number of retries for failed requests
             max_runtime (int): Maximum runtime in seconds (default: 5 minutes)
+            progress_callback (callable): Optional function called as (site, page, total_pages)
+                when the scraper starts on a new page of results
         """
         self.max_pages = max_pages
         self.delay_min = delay_min
@@ -124,6 +190,7 @@ class JobScraper:
         self.max_runtime = max_runtime
         self.interrupted = False
         self.date_filter = date_filter
+        self.progress_callback = progress_callback
         
         # Configure date filtering
         self.date_threshold = None
@@ -145,8 +212,7 @@ class JobScraper:
             logger.info(f"Date filtering enabled: Only showing jobs after {self.date_threshold}")
         
         # Set up signal handlers for graceful shutdown
-        signal.signal(signal.SIGINT, self._handle_interrupt)
-        signal.signal(signal.SIGTERM, self._handle_interrupt)
+        self._setup_signal_handlers()
         
         # Enhanced headers to look more like a real browser
         self.headers = {
@@ -160,6 +226,19 @@ class JobScraper:
             'TE': 'Trailers'
         }
     
+    def _setup_signal_handlers(self):
+        """Install SIGINT/SIGTERM handlers for graceful shutdown."""
+        signal.signal(signal.SIGINT, self._handle_interrupt)
+        signal.signal(signal.SIGTERM, self._handle_interrupt)
+    
+    def _report_progress(self, site, page, total_pages):
+        """Notify the progress callback, if any, that a new page is being scraped."""
+        if self.progress_callback:
+            try:
+                self.progress_callback(site, page, total_pages)
+            except Exception as e:
+                logger.debug(f"Progress callback failed: {str(e)}")
+    
     def _random_delay(self):
         """Sleep for a random amount of time between requests."""
         delay = random.uniform(self.delay_min, self.delay_max)
@@ -469,10 +548,12 @@ class JobScraper:
             ]
             
             # Use query rotation to avoid detection and get more diverse results
-            for current_query in additional_queries[:4]:  # Utiliser 4 requêtes au lieu de 2
+            for page, current_query in enumerate(additional_queries[:4], 1):  # Utiliser 4 requêtes au lieu de 2
                 if self._check_timeout():
                     logger.warning("Time limit reached. Stopping scraping early.")
                     break
+                
+                self._report_progress("Indeed", page, 4)
                     
                 try:
                     logger.info(f"Trying Indeed query: {current_query}")
@@ -649,10 +730,12 @@ class JobScraper:
                 "underwriter immobilier"                
             ]
             
-            for current_query in additional_queries[:4]:  # Utiliser 4 requêtes au lieu de 2
+            for page, current_query in enumerate(additional_queries[:4], 1):  # Utiliser 4 requêtes au lieu de 2
                 if self._check_timeout():
                     logger.warning("Time limit reached. Stopping scraping early.")
                     break
+                
+                self._report_progress("Indeed", page, 4)
                     
                 # Try using an RSS feed which is less likely to be blocked
                 encoded_query = urllib.parse.quote_plus(current_query)
@@ -1169,6 +1252,7 @@ class JobScraper:
         location_formatted = location.replace(' ', '%20')
         
         for page in tqdm(range(0, self.max_pages * 25, 25), desc="LinkedIn Pages"):
+            self._report_progress("LinkedIn", page // 25 + 1, self.max_pages)
             url = f"https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search?keywords={query_formatted}&location={location_formatted}&start={page}"
             
             try:
@@ -1251,10 +1335,12 @@ class JobScraper:
             f"{query} vente"
         ]
         
-        for current_query in query_variations:
+        for page, current_query in enumerate(query_variations, 1):
             if self._check_timeout():
                 logger.warning("Time limit reached. Stopping scraping early.")
                 break
+            
+            self._report_progress("APEC", page, len(query_variations))
                 
             # APEC has a reliable URL structure
             url = f"https://www.apec.fr/candidat/recherche-emploi.html/emploi?motsCles={current_query}&localisation={location}"
@@ -1402,28 +1488,10 @@ class JobScraper:
             
             for job in self.jobs:
                 # Create a more comprehensive key for better deduplication
-                title = job.get('title', '').lower().strip()
-                company = job.get('company', '').lower().strip()
+                key = job_key(job)
                 
-                # Include URL in the key if available (makes deduplication less aggressive)
-                url_part = ""
-                if 'url' in job:
-                    # Extract domain and path from URL to use as part of the key
-                    url = job['url']
-                    try:
-                        from urllib.parse import urlparse
-                        parsed_url = urlparse(url)
-                        # Just use the domain and path, not query parameters
-                        url_part = f"|{parsed_url.netloc}{parsed_url.path}"
-                    except:
-                        # If URL parsing fails, just use the URL as is
-                        url_part = f"|{url[-30:]}"
-                
-                # Create a key using multiple fields
-                job_key = f"{title}|{company}{url_part}"
-                
-                if job_key not in seen_jobs:
-                    seen_jobs.add(job_key)
+                if key not in seen_jobs:
+                    seen_jobs.add(key)
                     unique_jobs.append(job)
             
             # Update with deduplicated list
@@ -1439,6 +1507,71 @@ class JobScraper:
             logger.info(f"Successfully saved {len(self.jobs)} total jobs to {filename}")
         except Exception as e:
             logger.error(f"Error saving jobs to {filename}: {str(e)}")
+    
+    def append_to_jsonl(self, filename="real_estate_jobs_paris.jsonl", compact_ratio=0.1):
+        """
+        Append the scraped jobs that are not in the archive yet to a JSON Lines file.
+        
+        Unlike save_to_json, the archive is never rewritten on a normal save: only the
+        new jobs are written, one per line. The file is compacted (rewritten without
+        duplicate or corrupt lines) only when those make up more than compact_ratio
+        of its lines. If the archive does not exist yet, the jobs of the legacy JSON
+        file with the same base name are imported first.
+        
+        Args:
+            filename (str): Name of the JSONL file to append data to
+            compact_ratio (float): Fraction of stale lines that triggers a compaction
+            
+        Returns:
+            int: Number of jobs appended
+            
+        Raises:
+            Exception: Any error reading or writing the archive, after logging it,
+                so callers don't report jobs as saved when they weren't
+        """
+        try:
+            jobs_to_write = self.jobs
+            legacy_filename = os.path.splitext(filename)[0] + ".json"
+            if not os.path.exists(filename) and os.path.exists(legacy_filename):
+                jobs_to_write = self.load_from_json(legacy_filename) + self.jobs
+            
+            existing_jobs, seen_keys, stale_lines = load_jobs_jsonl(filename)
+            
+            new_jobs = []
+            for job in jobs_to_write:
+                key = job_key(job)
+                if key not in seen_keys:
+                    seen_keys.add(key)
+                    new_jobs.append(job)
+            
+            if stale_lines > compact_ratio * (len(existing_jobs) + stale_lines):
+                # Rewrite the archive without the stale lines, then append as usual
+                logger.info(f"Compacting {filename}: removing {stale_lines} duplicate or corrupt lines")
+                tmp_filename = filename + ".tmp"
+                with open(tmp_filename, 'w', encoding='utf-8') as f:
+                    for job in existing_jobs:
+                        f.write(json.dumps(job, ensure_ascii=False) + "\n")
+                os.replace(tmp_filename, filename)
+            
+            # A run interrupted mid-write can leave a last line without its newline,
+            # start on a new line so the first appended job isn't merged into it
+            needs_newline = False
+            if new_jobs and os.path.exists(filename) and os.path.getsize(filename) > 0:
+                with open(filename, 'rb') as f:
+                    f.seek(-1, os.SEEK_END)
+                    needs_newline = f.read(1) != b"\n"
+            
+            with open(filename, 'a', encoding='utf-8') as f:
+                if needs_newline:
+                    f.write("\n")
+                for job in new_jobs:
+                    f.write(json.dumps(job, ensure_ascii=False) + "\n")
+            
+            logger.info(f"Appended {len(new_jobs)} new jobs to {filename}")
+            return len(new_jobs)
+        except Exception as e:
+            logger.error(f"Error appending jobs to {filename}: {str(e)}")
+            raise
 
 def main():
     """Main function to run the job scraper."""
@@ -1452,8 +1585,9 @@ def main():
     
     # Group arguments by category for better organization
     output_group = parser.add_argument_group('Output Options')
-    output_group.add_argument('--output', type=str, default='real_estate_jobs_paris.json', 
-                       help='Output JSON filename')
+    output_group.add_argument('--output', type=str, default='real_estate_jobs_paris.jsonl', 
+                       help='Output filename, a .jsonl file is the archive shared with the GUI, '
+                            'anything else is saved as a JSON array')
     output_group.add_argument('--backup-interval', type=int, default=60, 
                        help='Backup interval in seconds')
     output_group.add_argument('--report', action='store_true',
@@ -1513,7 +1647,7 @@ def main():
     last_backup = start_time
     
     # Failsafe file to recover data in case of crash
-    failsafe_file = f"failsafe_{args.output}"
+    failsafe_file = f"failsafe_{os.path.splitext(args.output)[0]}.json"
     
     # Try to load previous data if failsafe file exists
     try:
@@ -1638,10 +1772,14 @@ def main():
             last_backup = current_time
             logger.info(f"Periodic backup saved with {len(scraper.jobs)} jobs")
         
-        # Deduplication is now handled by the save_to_json method
+        # Deduplication is handled by append_to_jsonl and save_to_json
         
-        # Save all collected jobs to JSON file
-        scraper.save_to_json(filename=args.output)
+        # Save all collected jobs, appending them to the JSON Lines archive the GUI
+        # loads unless a plain JSON output file was asked for
+        if args.output.endswith('.jsonl'):
+            scraper.append_to_jsonl(filename=args.output)
+        else:
+            scraper.save_to_json(filename=args.output)
         
         # If successful, clean up temporary files
         if os.path.exists(failsafe_file):
@@ -1706,14 +1844,16 @@ def main():
         
     except KeyboardInterrupt:
         logger.warning("Job scraping interrupted by user")
-        # Save what we have so far
-        scraper.save_to_json(filename=f"interrupted_{args.output}")
-        logger.info(f"Saved {len(scraper.jobs)} jobs to interrupted_{args.output}")
+        # Save what we have so far, as a JSON array like the failsafe file
+        interrupted_file = f"interrupted_{os.path.splitext(args.output)[0]}.json"
+        scraper.save_to_json(filename=interrupted_file)
+        logger.info(f"Saved {len(scraper.jobs)} jobs to {interrupted_file}")
     except Exception as e:
         logger.error(f"Error during scraping: {str(e)}")
-        # Save what we have so far
-        scraper.save_to_json(filename=f"error_{args.output}")
-        logger.info(f"Saved {len(scraper.jobs)} jobs to error_{args.output}")
+        # Save what we have so far, as a JSON array like the failsafe file
+        error_file = f"error_{os.path.splitext(args.output)[0]}.json"
+        scraper.save_to_json(filename=error_file)
+        logger.info(f"Saved {len(scraper.jobs)} jobs to {error_file}")
     
 if __name__ == "__main__":
     main()
@@ -7,23 +7,54 @@ Allows configuration of scraping parameters and displays results.
 """
 
 import os
+import re
+import sys
+import io
+import csv
 import json
+import math
+import functools
 import time
+import asyncio
+import queue
 import threading
 import tkinter as tk
-from datetime import datetime
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from tkinter import filedialog, messagebox
 from typing import List, Dict, Any, Optional, Tuple
 import logging
-import pandas as pd
 import openai
 import webbrowser
+import zipfile
+from xml.sax.saxutils import escape, quoteattr
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font
+from openpyxl.utils import get_column_letter
+
+# Shared font of the Excel header cells, so openpyxl registers a single style
+_HEADER_FONT = Font(bold=True)
+
+# xlsxwriter streams rows to disk faster than openpyxl, use it for exports when installed
+try:
+    import xlsxwriter
+except ImportError:
+    xlsxwriter = None
+
+# orjson parses JSON several times faster than the json module, use it when installed
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 # Import the customtkinter library for modern UI
 import customtkinter as ctk
-from PIL import Image, ImageTk
 
 # Import the JobScraper class from job_scraper.py
-from job_scraper import JobScraper, setup_logging
+from job_scraper import JobScraper, load_jobs_jsonl, setup_logging
 
 # Set appearance mode and default color theme
 ctk.set_appearance_mode("System")  # Modes: "System", "Dark", "Light"
@@ -34,6 +65,73 @@ logger = setup_logging(log_file="gui_scraper.log")
 
 # OpenAI client configuration
 openai_client = None
+async_openai_client = None
+
+# Maximum number of salary evaluations in flight when evaluating all jobs
+MAX_CONCURRENT_EVALUATIONS = 8
+
+# Maximum number of rows per Excel sheet (Excel allows 1,048,576) and of sheets per exported file
+EXCEL_SHEET_ROWS = 250_000
+EXCEL_MAX_SHEETS = 4
+
+# Exports with more rows than this write the worksheet XML directly instead of going through a library
+DIRECT_XML_MIN_ROWS = 50_000
+
+# Number of job cards built at a time, more are built as the list is scrolled down
+RENDER_BATCH_SIZE = 50
+
+# Delay after the last keystroke before the search filter is applied, in milliseconds
+SEARCH_DEBOUNCE_MS = 150
+
+# Maximum number of hidden job cards kept for reuse
+CARD_POOL_SIZE = 200
+
+# Number of leading jobs sampled to size the Excel columns
+WIDTH_SAMPLE_ROWS = 500
+
+# Widest measured Excel column, long text columns get a fixed width instead
+MAX_COLUMN_WIDTH = 40
+_FIXED_COLUMN_WIDTHS = {'description': 50}
+
+# Exports of more jobs than this default to CSV in the save dialog
+CSV_DEFAULT_MIN_ROWS = 5000
+
+# Number of parsed result files kept in memory for quick reopening
+JSON_CACHE_SIZE = 3
+
+# Exports of fewer jobs than this are built in memory and written to disk in one go
+EXPORT_BUFFER_MAX_ROWS = 100_000
+
+# Deflate level of directly written exports, level 1 is several times faster
+# than the default on long descriptions for a slightly larger file
+DIRECT_XML_COMPRESS_LEVEL = 1
+
+# Low-cardinality job fields interned before export so repeated values share one string object
+_INTERNED_COLUMNS = ('company', 'source', 'location')
+
+# Map the UI date filter options to the scraper date filter format
+_DATE_FILTER_MAP = {
+    "Last 24 hours": "1day",
+    "Last week": "1week",
+    "Last 2 weeks": "2weeks",
+    "Last month": "1month"
+}
+
+# Number of days covered by the job list date filter options
+_DATE_FILTER_DAYS = {
+    "Last 24 hours": 1,
+    "Last week": 7,
+    "Last 2 weeks": 14,
+    "Last month": 31
+}
+
+# Map the user-friendly sort options to the corresponding job data field
+_SORT_KEY_MAP = {
+    "Date": "scraped_date",
+    "Source": "source",
+    "Company": "company",
+    "Salary": "estimated_salary"
+}
 
 def setup_openai_client(api_key=None):
     """Setup OpenAI client with API key from environment variable or provided key.
@@ -44,7 +142,7 @@ def setup_openai_client(api_key=None):
     Returns:
         True if client was successfully setup, False otherwise.
     """
-    global openai_client
+    global openai_client, async_openai_client
     
     # Use provided API key or check environment variable
     if not api_key:
@@ -53,6 +151,7 @@ def setup_openai_client(api_key=None):
     if api_key:
         try:
             openai_client = openai.OpenAI(api_key=api_key)
+            async_openai_client = openai.AsyncOpenAI(api_key=api_key)
             # Save the API key to environment variable for future use
             os.environ["OPENAI_API_KEY"] = api_key
             return True
@@ -78,6 +177,41 @@ except Exception as e:
 setup_openai_client()
 
 
+def _salary_prompt(job_title: str, company: str) -> str:
+    """Build the salary estimation prompt for a job."""
+    return f"Je suis en France. Estime le salaire annuel en euros pour un poste de '{job_title}' chez '{company}' à Paris, France. Donne seulement le montant numérique sans texte. Par exemple: 45000"
+
+
+def _parse_salary_response(response) -> Tuple[float, str]:
+    """Extract the salary from an OpenAI chat completion response.
+    
+    Args:
+        response: The chat completion response returned by the API
+        
+    Returns:
+        Tuple containing the estimated salary as float and the currency
+    """
+    # Log the full response for debugging
+    logger.info(f"Full API response: {response}")
+    
+    # Extract the salary from the response
+    salary_text = response.choices[0].message.content.strip()
+    logger.info(f"Salary response content: {salary_text}")
+    
+    # Try to parse the salary as a number
+    # Remove any non-numeric characters except decimal point
+    salary_text = ''.join([c for c in salary_text if c.isdigit() or c == '.'])
+    
+    # Check if we have a valid number
+    if not salary_text:
+        logger.error(f"No valid salary numbers found in response: {response.choices[0].message.content}")
+        return (0, "EUR")
+        
+    salary = float(salary_text)
+    
+    return (salary, "EUR")
+
+
 def evaluate_salary(job_title: str, company: str) -> Tuple[float, str]:
     """Evaluate salary for a job using OpenAI API.
     
@@ -96,7 +230,7 @@ def evaluate_salary(job_title: str, company: str) -> Tuple[float, str]:
     
     try:
         # Prompt the model to estimate the salary with more specific instructions
-        prompt = f"Je suis en France. Estime le salaire annuel en euros pour un poste de '{job_title}' chez '{company}' à Paris, France. Donne seulement le montant numérique sans texte. Par exemple: 45000"
+        prompt = _salary_prompt(job_title, company)
         
         # Call OpenAI API with gpt-4o-mini model
         response = openai_client.chat.completions.create(
@@ -106,36 +240,404 @@ def evaluate_salary(job_title: str, company: str) -> Tuple[float, str]:
             max_tokens=10  # Only need a short response with the salary
         )
         
-        # Log the full response for debugging
-        logger.info(f"Full API response: {response}")
-        
-        # Extract the salary from the response
-        salary_text = response.choices[0].message.content.strip()
-        logger.info(f"Salary response content: {salary_text}")
+        return _parse_salary_response(response)
         
-        # Try to parse the salary as a number
-        # Remove any non-numeric characters except decimal point
-        salary_text = ''.join([c for c in salary_text if c.isdigit() or c == '.'])
+    except Exception as e:
+        logger.error(f"Error evaluating salary: {str(e)}")
+        return (0, "EUR")
+
+
+async def evaluate_salary_async(job_title: str, company: str) -> Tuple[float, str]:
+    """Evaluate salary for a job using the asynchronous OpenAI client.
+    
+    Args:
+        job_title: The job title to evaluate
+        company: The company offering the job
         
-        # Check if we have a valid number
-        if not salary_text:
-            logger.error(f"No valid salary numbers found in response: {response.choices[0].message.content}")
+    Returns:
+        Tuple containing the estimated salary as float and the currency
+    """
+    global async_openai_client
+    
+    if not async_openai_client:
+        if not setup_openai_client():
             return (0, "EUR")
-            
-        salary = float(salary_text)
+    
+    try:
+        response = await async_openai_client.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=[{"role": "user", "content": _salary_prompt(job_title, company)}],
+            temperature=0.1,
+            max_tokens=10
+        )
         
-        return (salary, "EUR")
+        return _parse_salary_response(response)
         
     except Exception as e:
         logger.error(f"Error evaluating salary: {str(e)}")
         return (0, "EUR")
 
+
+def _sheet_name(index: int, sheet_count: int) -> str:
+    """Name of the index-th job listings sheet of a workbook."""
+    return 'Job Listings' if sheet_count == 1 else f'Job Listings {index + 1}'
+
+
+def _progress_step(segments: List[List[Dict[str, Any]]]) -> Tuple[int, int]:
+    """Total row count of an export and how many rows to write between progress reports.
+    
+    Reporting every 1% keeps the number of status updates bounded whatever the export size.
+    """
+    total_rows = sum(len(jobs) for jobs in segments)
+    return total_rows, max(1, total_rows // 100)
+
+
+def _write_in_place(file_path: str, write):
+    """Write a file through a temporary .part file that replaces file_path once complete.
+    
+    A failed or interrupted export then leaves any previous file at file_path untouched.
+    
+    Args:
+        file_path: Path of the file to create
+        write: Function called with the path to write to
+    """
+    part_path = file_path + '.part'
+    try:
+        write(part_path)
+        os.replace(part_path, file_path)
+    except BaseException:
+        try:
+            os.remove(part_path)
+        except OSError:
+            pass
+        raise
+
+
+# Leading characters that make spreadsheet applications read a CSV cell as a formula
+_CSV_FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+
+def _csv_value(value):
+    """CSV cell of a job field, text that would be read as a formula gets a leading quote."""
+    if isinstance(value, str) and value.startswith(_CSV_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def _write_csv(file_path: str, jobs: List[Dict[str, Any]], columns: List[str], progress_callback=None):
+    """Write jobs to a CSV file, one job per row under a header row of the column names.
+    
+    Args:
+        file_path: Path of the CSV file to create
+        jobs: Job dictionaries to write
+        columns: Ordered column names
+        progress_callback: Optional function called as (rows_written, total_rows)
+    """
+    total_rows, step = _progress_step([jobs])
+    # utf-8-sig so Excel detects the encoding of accented text when opening the file
+    with open(file_path, 'w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        for start in range(0, total_rows, step):
+            writer.writerows([_csv_value(job.get(column, '')) for column in columns]
+                             for job in jobs[start:start + step])
+            if progress_callback:
+                progress_callback(min(start + step, total_rows), total_rows)
+
+
+def _write_xlsx_openpyxl(file_path, segments: List[List[Dict[str, Any]]], columns: List[str],
+                         widths: List[float], progress_callback=None):
+    """Write jobs to an Excel file with a write-only openpyxl workbook.
+    
+    Args:
+        file_path: Path or binary file object of the Excel file to create
+        segments: Job dictionaries to write, one list per sheet and one job per row
+        columns: Ordered column names, written as the header row of each sheet
+        widths: Width of each column
+        progress_callback: Optional function called as (rows_written, total_rows)
+    """
+    # Stream the rows with a write-only workbook, which serializes each row
+    # as it is appended instead of keeping every cell in memory
+    workbook = Workbook(write_only=True)
+    total_rows, step = _progress_step(segments)
+    written = 0
+    
+    for index, jobs in enumerate(segments):
+        worksheet = workbook.create_sheet(_sheet_name(index, len(segments)))
+        
+        # Column widths must be set before any row is appended in write-only mode
+        for column_index, width in enumerate(widths, 1):
+            worksheet.column_dimensions[get_column_letter(column_index)].width = width
+        
+        # Bold header row
+        header = []
+        for column in columns:
+            cell = WriteOnlyCell(worksheet, value=column)
+            cell.font = _HEADER_FONT
+            header.append(cell)
+        worksheet.append(header)
+        
+        for job in jobs:
+            worksheet.append([job.get(column, "") for column in columns])
+            written += 1
+            if progress_callback and written % step == 0:
+                progress_callback(written, total_rows)
+    
+    workbook.save(file_path)
+
+
+def _write_xlsx_xlsxwriter(file_path, segments: List[List[Dict[str, Any]]], columns: List[str],
+                           widths: List[float], progress_callback=None):
+    """Write jobs to an Excel file with xlsxwriter in constant memory mode.
+    
+    Args:
+        file_path: Path or binary file object of the Excel file to create
+        segments: Job dictionaries to write, one list per sheet and one job per row
+        columns: Ordered column names, written as the header row of each sheet
+        widths: Width of each column
+        progress_callback: Optional function called as (rows_written, total_rows)
+    """
+    # constant_memory flushes each row to a temporary file once it is written,
+    # the strings_to_* options skip the URL, number and formula checks on every
+    # string cell so scraped text is always written as plain text
+    workbook = xlsxwriter.Workbook(file_path, {
+        'constant_memory': True,
+        'strings_to_urls': False,
+        'strings_to_numbers': False,
+        'strings_to_formulas': False,
+    })
+    header_format = workbook.add_format({'bold': True})
+    total_rows, step = _progress_step(segments)
+    written = 0
+    
+    for index, jobs in enumerate(segments):
+        worksheet = workbook.add_worksheet(_sheet_name(index, len(segments)))
+        
+        for column_index, width in enumerate(widths):
+            worksheet.set_column(column_index, column_index, width)
+        
+        worksheet.write_row(0, 0, columns, header_format)
+        for row, job in enumerate(jobs, 1):
+            worksheet.write_row(row, 0, [job.get(column, "") for column in columns])
+            written += 1
+            if progress_callback and written % step == 0:
+                progress_callback(written, total_rows)
+    
+    workbook.close()
+
+
+# Minimal package parts of an XLSX file written by _write_xlsx_direct
+_XML_HEADER = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+_SPREADSHEET_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_RELATIONSHIP_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_PACKAGE_RELS = (
+    _XML_HEADER +
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    f'<Relationship Id="rId1" Type="{_RELATIONSHIP_NS}/officeDocument" Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+_STYLES_XML = (
+    _XML_HEADER +
+    f'<styleSheet xmlns="{_SPREADSHEET_NS}">'
+    '<fonts count="2"><font><sz val="11"/><name val="Calibri"/></font>'
+    '<font><b/><sz val="11"/><name val="Calibri"/></font></fonts>'
+    '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+    '<fill><patternFill patternType="gray125"/></fill></fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="2"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    '<xf numFmtId="0" fontId="1" fillId="0" borderId="0" xfId="0" applyFont="1"/></cellXfs>'
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    '</styleSheet>'
+)
+
+# Control characters that are not allowed in XML documents
+_ILLEGAL_XML_CHARS = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+
+def _cell_xml(reference: str, value, style: str = "") -> str:
+    """Serialize a single cell value, or return an empty string for blank cells."""
+    if value is None or value == "":
+        return ""
+    if isinstance(value, bool):
+        return f'<c r="{reference}"{style} t="b"><v>{int(value)}</v></c>'
+    # Only finite numbers are valid number cells, NaN and infinities are written as text
+    if (isinstance(value, int) and not isinstance(value, bool)) or (
+            isinstance(value, float) and math.isfinite(value)):
+        return f'<c r="{reference}"{style}><v>{value}</v></c>'
+    text = escape(_ILLEGAL_XML_CHARS.sub("", str(value)))
+    return f'<c r="{reference}"{style} t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>'
+
+
+def _sheet_xml_start(columns: List[str], widths: List[float], row_count: int) -> str:
+    """XML of a worksheet up to and including its bold header row."""
+    cols = "".join(
+        f'<col min="{index}" max="{index}" width="{width}" customWidth="1"/>'
+        for index, width in enumerate(widths, 1)
+    )
+    header = "".join(
+        _cell_xml(f"{get_column_letter(index)}1", column, ' s="1"')
+        for index, column in enumerate(columns, 1)
+    )
+    return (
+        _XML_HEADER +
+        f'<worksheet xmlns="{_SPREADSHEET_NS}">'
+        f'<dimension ref="A1:{get_column_letter(len(columns))}{row_count + 1}"/>'
+        f'<cols>{cols}</cols><sheetData><row r="1">{header}</row>'
+    )
+
+
+def _rows_xml(jobs: List[Dict[str, Any]], columns: List[str], letters: List[str], first_row: int) -> str:
+    """XML of the rows holding the given jobs, the first one being sheet row first_row."""
+    rows = []
+    for row, job in enumerate(jobs, first_row):
+        cells = "".join(
+            _cell_xml(f"{letter}{row}", job.get(column)) for letter, column in zip(letters, columns)
+        )
+        rows.append(f'<row r="{row}">{cells}</row>')
+    return "".join(rows)
+
+
+_SHEET_XML_END = '</sheetData></worksheet>'
+
+
+def _write_xlsx_direct(file_path, segments: List[List[Dict[str, Any]]], columns: List[str],
+                       widths: List[float], progress_callback=None):
+    """Write jobs to an Excel file by streaming the worksheet XML into the package directly.
+    
+    This skips the per-cell objects of the Excel libraries, which dominate the
+    export time of very large job lists.
+    
+    Args:
+        file_path: Path or binary file object of the Excel file to create
+        segments: Job dictionaries to write, one list per sheet and one job per row
+        columns: Ordered column names, written as the header row of each sheet
+        widths: Width of each column
+        progress_callback: Optional function called as (rows_written, total_rows)
+    """
+    sheet_count = len(segments)
+    sheet_overrides = "".join(
+        f'<Override PartName="/xl/worksheets/sheet{index}.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        for index in range(1, sheet_count + 1)
+    )
+    content_types = (
+        _XML_HEADER +
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/styles.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+        f'{sheet_overrides}</Types>'
+    )
+    sheets = "".join(
+        f'<sheet name={quoteattr(_sheet_name(index, sheet_count))} sheetId="{index + 1}" r:id="rId{index + 1}"/>'
+        for index in range(sheet_count)
+    )
+    workbook_xml = (
+        _XML_HEADER +
+        f'<workbook xmlns="{_SPREADSHEET_NS}" xmlns:r="{_RELATIONSHIP_NS}"><sheets>{sheets}</sheets></workbook>'
+    )
+    sheet_rels = "".join(
+        f'<Relationship Id="rId{index}" Type="{_RELATIONSHIP_NS}/worksheet" Target="worksheets/sheet{index}.xml"/>'
+        for index in range(1, sheet_count + 1)
+    )
+    workbook_rels = (
+        _XML_HEADER +
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        f'{sheet_rels}<Relationship Id="rId{sheet_count + 1}" Type="{_RELATIONSHIP_NS}/styles" Target="styles.xml"/>'
+        '</Relationships>'
+    )
+    
+    with zipfile.ZipFile(file_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=DIRECT_XML_COMPRESS_LEVEL) as package:
+        package.writestr('[Content_Types].xml', content_types)
+        package.writestr('_rels/.rels', _PACKAGE_RELS)
+        package.writestr('xl/workbook.xml', workbook_xml)
+        package.writestr('xl/_rels/workbook.xml.rels', workbook_rels)
+        package.writestr('xl/styles.xml', _STYLES_XML)
+        
+        total_rows, step = _progress_step(segments)
+        written = 0
+        
+        letters = [get_column_letter(index) for index in range(1, len(columns) + 1)]
+        for index, jobs in enumerate(segments, 1):
+            with package.open(f'xl/worksheets/sheet{index}.xml', 'w', force_zip64=True) as sheet:
+                sheet.write(_sheet_xml_start(columns, widths, len(jobs)).encode('utf-8'))
+                
+                # Serialize a progress step worth of rows at a time
+                for start in range(0, len(jobs), step):
+                    block = jobs[start:start + step]
+                    sheet.write(_rows_xml(block, columns, letters, start + 2).encode('utf-8'))
+                    written += len(block)
+                    if progress_callback:
+                        progress_callback(written, total_rows)
+                
+                sheet.write(_SHEET_XML_END.encode('utf-8'))
+
+
+class ThreadSafeJobScraper(JobScraper):
+    """JobScraper variant that can run outside the main thread.
+    
+    Signal handlers can only be installed from the main thread, so they are
+    skipped and interruption is done through the interrupted flag instead.
+    """
+    
+    def _setup_signal_handlers(self):
+        # Signal handlers can only be installed from the main thread
+        logging.debug("Skipping signal setup in threaded context")
+    
+    # Override _handle_interrupt to avoid using signals
+    def _handle_interrupt(self, *args):
+        logging.info("Scraper interrupted")
+        self.interrupted = True
+        
+        # Still save progress when interrupted
+        try:
+            if self.jobs:
+                filename = f"interrupted_scraper_{int(time.time())}.json"
+                with open(filename, 'w', encoding='utf-8') as f:
+                    json.dump(self.jobs, f, ensure_ascii=False, indent=2)
+                logging.info(f"Saved current progress to {filename}")
+        except Exception as e:
+            logging.error(f"Failed to save progress during interrupt: {str(e)}")
+
+
+# Job fields searched by the search bar
+_SEARCH_FIELDS = ('title', 'company', 'location', 'source', 'description')
+
+
+def _search_blob(job: Dict[str, Any]) -> str:
+    """Lowercase text of all searched fields of a job, separated so matches can't span fields."""
+    return "\x1f".join(job.get(field) or "" for field in _SEARCH_FIELDS).lower()
+
+
+def _job_date(job: Dict[str, Any]) -> Optional[date]:
+    """Scraped date of a job, or None if it is missing or can't be parsed."""
+    try:
+        return date.fromisoformat(job.get('scraped_date') or '')
+    except (ValueError, TypeError):
+        return None
+
+
 class ScrollableJobFrame(ctk.CTkScrollableFrame):
     """A scrollable frame to display job listings with filtering capabilities."""
     
     def __init__(self, master, **kwargs):
         super().__init__(master, **kwargs)
-        self.job_frames = []
+        self.jobs = []  # All jobs, in display order
+        self.visible_jobs = []  # Jobs matching the current filters, in display order
+        self.job_frames = []  # Frames of the visible jobs built so far, in display order
+        self._frame_by_key = {}  # Maps id(job) to the frame displaying it
+        self._pool = []  # Hidden job frames kept for reuse
+        # Filtered fields are kept in lists parallel to self.jobs, so filtering
+        # indexes flat lists instead of looking up and converting dict values
+        self._search_blobs = []  # Lowercase search text of each job
+        self._dates = []  # Parsed scraped date of each job, None if unknown
+        self._hits_needle = ""  # Search text that _text_hits were computed for
+        self._text_hits = None  # Indexes of the jobs matching _hits_needle, None when unknown
+        self._render_pending = False  # Whether building the next batch of frames is scheduled
         self.current_filter = ""
         self.sort_key = "scraped_date"  # Default sort key
         self.sort_ascending = False  # Default sort order (newest first)
@@ -143,138 +645,262 @@ class ScrollableJobFrame(ctk.CTkScrollableFrame):
         self.evaluating_all = False  # Flag to track if we're currently evaluating all jobs
         self.date_filter = None  # Date filter (None = show all dates)
         
+        # Fonts shared by all job cards, each CTkFont creates a named Tk font
+        self._title_font = ctk.CTkFont(size=14, weight="bold")
+        self._bold_font = ctk.CTkFont(size=12, weight="bold")
+        self._body_font = ctk.CTkFont(size=12)
+        self._meta_font = ctk.CTkFont(size=10)
+        self._meta_bold_font = ctk.CTkFont(size=10, weight="bold")
+        
+        # Build more job frames when the list is scrolled near its end
+        self._parent_canvas.configure(yscrollcommand=self._on_canvas_scrolled)
+        
     def clear_jobs(self):
         """Clear all job listings from the frame."""
         for frame in self.job_frames:
-            frame.destroy()
+            self._release_job_card(frame)
+        self.jobs = []
+        self.visible_jobs = []
+        self.job_frames = []
+        self._frame_by_key = {}
+        self._search_blobs = []
+        self._dates = []
+        self._text_hits = None
+    
+    def set_jobs(self, jobs: List[Dict[str, Any]]):
+        """Replace the displayed jobs, building frames for the first visible ones only.
+        
+        Args:
+            jobs: The jobs to display, in display order
+        """
+        self.clear_jobs()
+        self.jobs = jobs
+        # Lowercase the searched text once per job instead of on every keystroke
+        self._search_blobs = [_search_blob(job) for job in jobs]
+        self._dates = [_job_date(job) for job in jobs]
+        self.filter_jobs()
+    
+    def reorder(self, ordered_jobs: List[Dict[str, Any]]):
+        """Reorder the displayed jobs to match the given job order.
+        
+        Frames already built for jobs that stay in view are reused.
+        
+        Args:
+            ordered_jobs: The displayed jobs, in their new order
+        """
+        # Move the filtered fields along with their jobs
+        position = {id(job): index for index, job in enumerate(self.jobs)}
+        try:
+            order = [position[id(job)] for job in ordered_jobs]
+        except KeyError:
+            order = None
+        if order is None or len(order) != len(self.jobs):
+            # Not a permutation of the displayed jobs, display them from scratch
+            self.set_jobs(ordered_jobs)
+            return
+        self._search_blobs = [self._search_blobs[index] for index in order]
+        self._dates = [self._dates[index] for index in order]
+        self.jobs = ordered_jobs
+        # Cached search results index the previous order
+        self._text_hits = None
+        self.filter_jobs()
+    
+    def _render_visible_jobs(self):
+        """Show the first batch of visible jobs, reusing their frames when they exist."""
+        count = min(max(len(self.job_frames), RENDER_BATCH_SIZE), len(self.visible_jobs))
+        shown = self.visible_jobs[:count]
+        shown_keys = {id(job) for job in shown}
+        
+        # Release the frames of jobs that are no longer in view, hide the others
+        for key, frame in list(self._frame_by_key.items()):
+            if key in shown_keys:
+                frame.pack_forget()
+            else:
+                self._release_job_card(frame)
+                del self._frame_by_key[key]
+        
         self.job_frames = []
+        for job in shown:
+            frame = self._frame_by_key.get(id(job))
+            if frame is None:
+                frame = self.add_job(job)
+            else:
+                frame.pack(fill="x", padx=12, pady=7, expand=True)
+                self.job_frames.append(frame)
+        
+        self._parent_canvas.yview_moveto(0)
+    
+    def _render_more(self):
+        """Build the frames of the next batch of visible jobs."""
+        self._render_pending = False
+        start = len(self.job_frames)
+        for job in self.visible_jobs[start:start + RENDER_BATCH_SIZE]:
+            self.add_job(job)
+    
+    def _on_canvas_scrolled(self, first, last):
+        """Update the scrollbar and build more frames once the end of the list comes into view."""
+        self._scrollbar.set(first, last)
+        if (float(last) > 0.9 and not self._render_pending
+                and len(self.job_frames) < len(self.visible_jobs)):
+            self._render_pending = True
+            self.after_idle(self._render_more)
         
     def add_job(self, job: Dict[str, Any]):
-        """Add a job listing to the scrollable frame."""
+        """Add a job listing to the end of the scrollable frame."""
+        # Reuse a released card when there is one, building a card costs far
+        # more than updating its texts
+        job_frame = self._pool.pop() if self._pool else self._create_job_card()
+        self._bind_job_card(job_frame, job)
+        job_frame.pack(fill="x", padx=12, pady=7, expand=True)
+        
+        self.job_frames.append(job_frame)
+        self._frame_by_key[id(job)] = job_frame
+        return job_frame
+    
+    def _release_job_card(self, job_frame):
+        """Hide a job card and keep it for reuse, or destroy it if the pool is full."""
+        if len(self._pool) < CARD_POOL_SIZE:
+            job_frame.pack_forget()
+            self._pool.append(job_frame)
+        else:
+            job_frame.destroy()
+    
+    def _create_job_card(self):
+        """Build the widgets of an empty job card, filled in by _bind_job_card."""
         # Create a frame for the job with improved visual styling
         job_frame = ctk.CTkFrame(self, fg_color=("gray95", "gray17"), corner_radius=12, border_width=1, border_color=("gray80", "gray30"))
-        job_frame.pack(fill="x", padx=12, pady=7, expand=True)
         
         # Create top row with title and evaluate button
         top_row = ctk.CTkFrame(job_frame, fg_color="transparent")
         top_row.pack(fill="x", padx=10, pady=(10, 0))
         top_row.grid_columnconfigure(0, weight=1)  # Make title expand
         
-        # Job title (bold) with clickable link
-        job_url = job.get("url", "")
-        title_text = job.get("title", "Unknown Title")
-        
+        # Job title (bold) with clickable link. The card's job changes when it
+        # is reused, so the callbacks look it up when they run.
         title_label = ctk.CTkLabel(
             top_row, 
-            text=title_text,
-            font=ctk.CTkFont(size=14, weight="bold"),
-            anchor="w",
-            cursor="hand2" if job_url else "arrow"
+            text="",
+            font=self._title_font,
+            anchor="w"
         )
         title_label.grid(row=0, column=0, sticky="w")
-        
-        # Add click binding to the title if URL exists
-        if job_url:
-            title_label.bind("<Button-1>", lambda e, url=job_url: self._open_job_url(url))
-            # Add underline to indicate clickable
-            title_label.configure(text_color=("blue", "light blue"))
+        title_label.bind("<Button-1>", lambda e, f=job_frame: self._open_job_url(f.job_data.get("url", "")))
+        job_frame.title_label = title_label
+        job_frame.title_color = title_label.cget("text_color")
         
         # Evaluate button with improved styling
         evaluate_button = ctk.CTkButton(
             top_row,
             text="💰 Evaluate",  # Added emoji for visual indicator
-            command=lambda j=job, f=job_frame: self._evaluate_job(j, f),
+            command=lambda f=job_frame: self._evaluate_job(f.job_data),
             width=90,
             height=28,
             fg_color=("#3a7ebf", "#1f538d"),  # Better color contrast
             hover_color=("#2d6db5", "#1a477a"),
             corner_radius=8,
             border_width=0,
-            font=ctk.CTkFont(size=12, weight="bold")
+            font=self._bold_font
         )
         evaluate_button.grid(row=0, column=1, padx=(5, 5))
-        
-        # Add URL button if URL exists
-        if job_url:
-            url_button = ctk.CTkButton(
-                top_row,
-                text="🔗 Voir l'annonce",  # Added emoji for visual indicator
-                command=lambda url=job_url: self._open_job_url(url),
-                width=120,
-                height=28,
-                fg_color=("#2e8b57", "#1e5631"),  # Better color contrast
-                hover_color=("#227346", "#19472a"),
-                corner_radius=8,
-                border_width=0,
-                font=ctk.CTkFont(size=12, weight="bold")
-            )
-            url_button.grid(row=0, column=2, padx=(0, 0))
-        
-        # Store reference to evaluate button
         job_frame.evaluate_button = evaluate_button
         
+        # URL button, only shown for jobs with a URL
+        url_button = ctk.CTkButton(
+            top_row,
+            text="🔗 Voir l'annonce",  # Added emoji for visual indicator
+            command=lambda f=job_frame: self._open_job_url(f.job_data.get("url", "")),
+            width=120,
+            height=28,
+            fg_color=("#2e8b57", "#1e5631"),  # Better color contrast
+            hover_color=("#227346", "#19472a"),
+            corner_radius=8,
+            border_width=0,
+            font=self._bold_font
+        )
+        url_button.grid(row=0, column=2, padx=(0, 0))
+        job_frame.url_button = url_button
+        
         # Company name
         company_label = ctk.CTkLabel(
             job_frame, 
-            text=f"Company: {job.get('company', 'Unknown Company')}",
-            font=ctk.CTkFont(size=12)
+            text="",
+            font=self._body_font
         )
         company_label.pack(anchor="w", padx=10, pady=(5, 0))
+        job_frame.company_label = company_label
         
-        # These widgets will be shown/hidden based on collapsed view
-        detail_widgets = []
-        
-        # Location
+        # Location, source and date are shown/hidden based on collapsed view
         location_label = ctk.CTkLabel(
             job_frame, 
-            text=f"Location: {job.get('location', 'Unknown Location')}",
-            font=ctk.CTkFont(size=12)
+            text="",
+            font=self._body_font
         )
         location_label.pack(anchor="w", padx=10, pady=(5, 0))
-        detail_widgets.append(location_label)
         
-        # Source and date
         source_date_label = ctk.CTkLabel(
             job_frame, 
-            text=f"Source: {job.get('source', 'Unknown')} | Date: {job.get('scraped_date', 'Unknown')}",
-            font=ctk.CTkFont(size=10),
+            text="",
+            font=self._meta_font,
             text_color=("gray50", "gray70")
         )
         source_date_label.pack(anchor="w", padx=10, pady=(5, 0))
-        detail_widgets.append(source_date_label)
+        job_frame.detail_widgets = [location_label, source_date_label]
+        job_frame.collapsed = False
         
-        # Salary estimation placeholder (initially hidden)
+        # Salary estimation placeholder
         salary_frame = ctk.CTkFrame(job_frame, fg_color="transparent")
         salary_frame.pack(fill="x", padx=10, pady=(5, 10))
         job_frame.salary_frame = salary_frame
         
-        # Store this frame with the job data and its detail widgets for filtering and collapsing
+        return job_frame
+    
+    def _bind_job_card(self, job_frame, job: Dict[str, Any]):
+        """Fill a job card with the details of a job."""
+        job_url = job.get("url", "")
+        
+        # Clickable blue title only when the job has a URL
+        job_frame.title_label.configure(
+            text=job.get("title", "Unknown Title"),
+            cursor="hand2" if job_url else "arrow",
+            text_color=("blue", "light blue") if job_url else job_frame.title_color
+        )
+        job_frame.evaluate_button.configure(state="disabled" if self.evaluating_all else "normal")
+        if job_url:
+            job_frame.url_button.grid()
+        else:
+            job_frame.url_button.grid_remove()
+        
+        job_frame.company_label.configure(text=f"Company: {job.get('company', 'Unknown Company')}")
+        location_label, source_date_label = job_frame.detail_widgets
+        location_label.configure(text=f"Location: {job.get('location', 'Unknown Location')}")
+        source_date_label.configure(
+            text=f"Source: {job.get('source', 'Unknown')} | Date: {job.get('scraped_date', 'Unknown')}"
+        )
+        self._set_card_collapsed(job_frame, self.collapsed_view)
+        
+        # Store the job on its card for the callbacks and filtering
         job_frame.job_data = job
-        job_frame.detail_widgets = detail_widgets
         job_frame.has_salary = False  # Flag to track if salary has been evaluated
-        self.job_frames.append(job_frame)
+        for widget in job_frame.salary_frame.winfo_children():
+            widget.destroy()
         
         # Check if job already has salary data (from previous evaluation)
         if 'estimated_salary' in job and 'estimated_fee' in job:
             # Job already has salary data, display it
-            job_frame.has_salary = True
-            salary_label = ctk.CTkLabel(
-                job_frame.salary_frame,
-                text=f"Estimated Salary: {job['estimated_salary']:,.2f} EUR",
-                font=ctk.CTkFont(size=12, weight="bold"),
-                text_color=("green4", "green3")
-            )
-            salary_label.pack(anchor="w")
-            
-            fee_label = ctk.CTkLabel(
-                job_frame.salary_frame,
-                text=f"Estimated Fee (25%): {job['estimated_fee']:,.2f} EUR",
-                font=ctk.CTkFont(size=12, weight="bold"),
-                text_color=("royalblue3", "royalblue2")
-            )
-            fee_label.pack(anchor="w")
+            self._show_salary(job_frame, job['estimated_salary'], job['estimated_fee'], "EUR")
+    
+    def _set_card_collapsed(self, job_frame, collapsed: bool):
+        """Hide or show the location, source and date of a job card."""
+        if job_frame.collapsed == collapsed:
+            return
+        job_frame.collapsed = collapsed
         
-        return job_frame
+        for widget in job_frame.detail_widgets:
+            if collapsed:
+                widget.pack_forget()
+            else:
+                # Re-add the widgets in their original place, above the salary info
+                widget.pack(anchor="w", padx=10, pady=(5, 0), before=job_frame.salary_frame)
         
     def filter_jobs(self, filter_text=None, date_filter=None):
         """Filter job listings based on search text and/or date filter.
@@ -283,112 +909,74 @@ class ScrollableJobFrame(ctk.CTkScrollableFrame):
             filter_text: Text to search for in job fields (if None, uses current filter)
             date_filter: Date filter option (e.g., "Last week", "Last month")
         """
+        previous_filter = self.current_filter
+        
         # Update filters if provided
         if filter_text is not None:
-            self.current_filter = filter_text.lower()
+            filter_text = filter_text.lower()
+            # Nothing to do if the search text didn't actually change
+            if filter_text == previous_filter and date_filter is None:
+                return
+            self.current_filter = filter_text
             
         if date_filter is not None:
             self.date_filter = date_filter
         
-        # Show/hide job frames based on combined filters
-        for frame in self.job_frames:
-            job_data = frame.job_data
-            
-            # Check text filter match
-            text_match = self._matches_text_filter(job_data)
-            
-            # Check date filter match
-            date_match = self._matches_date_filter(job_data)
-            
-            # Only show if both filters match
-            if text_match and date_match:
-                frame.pack(fill="x", padx=12, pady=7, expand=True)
+        # The jobs matching the search text are cached separately from the date
+        # filter, so changing the date filter doesn't search the text again
+        needle = self.current_filter
+        if self._text_hits is None or needle != self._hits_needle:
+            # A longer search text can only match jobs the shorter one matched, so
+            # when the user keeps typing only the previous hits are searched
+            if self._text_hits is not None and needle.startswith(self._hits_needle):
+                candidates = self._text_hits
             else:
-                frame.pack_forget()
-                
-    def _matches_text_filter(self, job_data):
-        """Check if a job matches the current text filter."""
-        if not self.current_filter:
-            return True
-            
-        # Extract fields to search
-        title = job_data.get("title", "").lower()
-        company = job_data.get("company", "").lower()
-        location = job_data.get("location", "").lower()
-        source = job_data.get("source", "").lower()
-        description = job_data.get("description", "").lower() if "description" in job_data else ""
-        
-        # Check if filter text appears in any field
-        return (self.current_filter in title or 
-                self.current_filter in company or 
-                self.current_filter in location or
-                self.current_filter in source or
-                self.current_filter in description)
-                
-    def _matches_date_filter(self, job_data):
-        """Check if a job matches the current date filter."""
-        # If no date filter is set, show all jobs
-        if not self.date_filter or self.date_filter == "Any time":
-            return True
-            
-        # Get job date and convert to datetime
-        job_date_str = job_data.get('scraped_date', '')
-        if not job_date_str:
-            return True  # Include jobs without dates to be safe
+                candidates = range(len(self.jobs))
             
-        try:
-            job_date = datetime.strptime(job_date_str, '%Y-%m-%d').date()
-            today = datetime.now().date()
-            days_ago = (today - job_date).days
-            
-            # Apply date filters
-            if self.date_filter == "Last 24 hours":
-                return days_ago <= 1
-            elif self.date_filter == "Last week":
-                return days_ago <= 7
-            elif self.date_filter == "Last 2 weeks":
-                return days_ago <= 14
-            elif self.date_filter == "Last month":
-                return days_ago <= 31
-            else:
-                return True
-        except (ValueError, TypeError):
-            # If date parsing fails, include the job
-            return True
+            # Every word of the search text must appear in the job's precomputed
+            # search blob. Words are matched longest first, as longer words
+            # usually match fewer jobs and leave less for the next passes.
+            blobs = self._search_blobs
+            for word in sorted(needle.split(), key=len, reverse=True):
+                candidates = [index for index in candidates if word in blobs[index]]
+            self._text_hits = candidates
+            self._hits_needle = needle
+        
+        # Only show jobs matching both filters, jobs without a valid date are
+        # always included to be safe
+        jobs = self.jobs
+        days = _DATE_FILTER_DAYS.get(self.date_filter)
+        if days is None:
+            self.visible_jobs = [jobs[index] for index in self._text_hits]
+        else:
+            cutoff = datetime.now().date() - timedelta(days=days)
+            dates = self._dates
+            self.visible_jobs = [
+                jobs[index] for index in self._text_hits
+                if dates[index] is None or dates[index] >= cutoff
+            ]
+        self._render_visible_jobs()
                 
     def toggle_collapsed_view(self, collapsed: bool):
         """Toggle between collapsed and expanded view for all job listings."""
         self.collapsed_view = collapsed
         
-        # Show/hide detail widgets based on collapsed state
+        # Show/hide detail widgets based on collapsed state, salary info stays visible
         for frame in self.job_frames:
-            if hasattr(frame, 'detail_widgets'):
-                for widget in frame.detail_widgets:
-                    if collapsed:
-                        widget.pack_forget()
-                    else:
-                        # Re-add the widgets in their original order
-                        if widget in frame.winfo_children():
-                            if isinstance(widget, ctk.CTkLabel) and "Location:" in widget._text:
-                                widget.pack(anchor="w", padx=10, pady=(5, 0))
-                            elif isinstance(widget, ctk.CTkLabel):
-                                widget.pack(anchor="w", padx=10, pady=(5, 0))
-                
-                # Always keep salary info visible if it exists
-                if hasattr(frame, 'salary_frame') and frame.has_salary:
-                    frame.salary_frame.pack(fill="x", padx=10, pady=(5, 10))
+            self._set_card_collapsed(frame, collapsed)
     
-    def _evaluate_job(self, job: Dict[str, Any], job_frame: ctk.CTkFrame):
-        """Evaluate the expected salary for a job and display it on the job frame."""
+    def _evaluate_job(self, job: Dict[str, Any]):
+        """Evaluate the expected salary for a job and display it on its frame."""
         # Don't re-evaluate if already done
-        if job_frame.has_salary:
+        job_frame = self._frame_by_key.get(id(job))
+        if job_frame is None or job_frame.has_salary:
             return
         
         # Check if OpenAI client is set up
         global openai_client
         if not openai_client:
             # Ask for API key if not configured
-            self._request_api_key(job, job_frame)
+            self._request_api_key(job)
             return
             
         # Get the job details
@@ -399,7 +987,7 @@ class ScrollableJobFrame(ctk.CTkScrollableFrame):
         progress_label = ctk.CTkLabel(
             job_frame.salary_frame,
             text="Evaluating salary...",
-            font=ctk.CTkFont(size=10, weight="bold"),
+            font=self._meta_bold_font,
             text_color=("gray50", "gray70")
         )
         progress_label.pack(anchor="w")
@@ -416,12 +1004,11 @@ class ScrollableJobFrame(ctk.CTkScrollableFrame):
             fee = salary * 0.25
             
             # Update UI in main thread
-            self.after(0, lambda: self._update_salary_display(
-                job_frame, progress_label, salary, fee, currency))
+            self.after(0, self._update_salary_display, job, salary, fee, currency)
         
         threading.Thread(target=evaluate_thread, daemon=True).start()
     
-    def _request_api_key(self, job: Dict[str, Any], job_frame: ctk.CTkFrame):
+    def _request_api_key(self, job: Dict[str, Any]):
         """Request OpenAI API key from user."""
         # Create a dialog to get the API key
         dialog = ctk.CTkToplevel(self.master)
@@ -484,7 +1071,7 @@ class ScrollableJobFrame(ctk.CTkScrollableFrame):
             if setup_openai_client(api_key):
                 dialog.destroy()
                 # Try evaluating again
-                self._evaluate_job(job, job_frame)
+                self._evaluate_job(job)
             else:
                 status_var.set("Invalid API key. Please try again.")
                 status_label.pack(pady=(0, 10))
@@ -516,16 +1103,21 @@ class ScrollableJobFrame(ctk.CTkScrollableFrame):
         # Focus on the entry
         key_entry.focus_set()
     
-    def _update_salary_display(self, job_frame, progress_label, salary, fee, currency):
-        """Update the job frame with the salary estimation results."""
-        # Clear existing contents of the salary frame
+    def _update_salary_display(self, job, salary, fee, currency):
+        """Store the salary estimation results of a job and show them if its frame is built."""
+        job['estimated_salary'] = salary
+        job['estimated_fee'] = fee
+        
+        job_frame = self._frame_by_key.get(id(job))
+        if job_frame is not None:
+            self._show_salary(job_frame, salary, fee, currency)
+    
+    def _show_salary(self, job_frame, salary, fee, currency):
+        """Display a salary estimation on a job frame."""
+        # Clear existing contents of the salary frame, including any progress label
         for widget in job_frame.salary_frame.winfo_children():
             widget.destroy()
         
-        # Remove the progress label if it exists
-        if progress_label is not None:
-            progress_label.destroy()
-        
         # Format the salary and fee
         salary_formatted = f"{salary:,.2f} {currency}" if salary > 0 else "Not available"
         fee_formatted = f"{fee:,.2f} {currency}" if salary > 0 else "Not available"
@@ -534,7 +1126,7 @@ class ScrollableJobFrame(ctk.CTkScrollableFrame):
         salary_label = ctk.CTkLabel(
             job_frame.salary_frame,
             text=f"Estimated Salary: {salary_formatted}",
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=self._bold_font,
             text_color=("green4", "green3")
         )
         salary_label.pack(anchor="w")
@@ -543,33 +1135,13 @@ class ScrollableJobFrame(ctk.CTkScrollableFrame):
         fee_label = ctk.CTkLabel(
             job_frame.salary_frame,
             text=f"Estimated Fee (25%): {fee_formatted}",
-            font=ctk.CTkFont(size=12, weight="bold"),
+            font=self._bold_font,
             text_color=("royalblue3", "royalblue2")
         )
         fee_label.pack(anchor="w")
         
-        # Mark this job as having salary info and store the salary value
+        # Mark this job as having salary info
         job_frame.has_salary = True
-        job_frame.job_data['estimated_salary'] = salary
-        job_frame.job_data['estimated_fee'] = fee
-        
-        # If we're in the process of evaluating all, continue with the next job
-        if self.evaluating_all and hasattr(self, 'remaining_jobs') and self.remaining_jobs:
-            self._evaluate_next_job()
-        # If we've finished evaluating all, sort by salary
-        elif self.evaluating_all and hasattr(self, 'remaining_jobs') and not self.remaining_jobs:
-            self._finish_evaluate_all()
-    
-    def _evaluate_next_job(self):
-        """Evaluate the next job in the queue during evaluate all process."""
-        if not self.evaluating_all or not hasattr(self, 'remaining_jobs') or not self.remaining_jobs:
-            return
-        
-        # Get the next job and frame
-        job, job_frame = self.remaining_jobs.pop(0)
-        
-        # Start the evaluation
-        self._evaluate_job(job, job_frame)
     
     def _open_job_url(self, url):
         """Open the job listing URL in the default web browser."""
@@ -580,7 +1152,6 @@ class ScrollableJobFrame(ctk.CTkScrollableFrame):
             except Exception as e:
                 logger.error(f"Error opening URL: {str(e)}")
                 # Show error in a messagebox
-                from tkinter import messagebox
                 messagebox.showerror("Erreur", f"Impossible d'ouvrir l'URL : {str(e)}")
     
     def _finish_evaluate_all(self):
@@ -590,8 +1161,7 @@ class ScrollableJobFrame(ctk.CTkScrollableFrame):
         
         # Re-enable all evaluate buttons
         for frame in self.job_frames:
-            if hasattr(frame, 'evaluate_button'):
-                frame.evaluate_button.configure(state="normal")
+            frame.evaluate_button.configure(state="normal")
         
         # Safely find the app instance to call sort by salary
         try:
@@ -635,6 +1205,8 @@ class JobScraperApp(ctk.CTk):
         try:
             icon_path = os.path.join(os.path.dirname(__file__), "assets", "icon.png")
             if os.path.exists(icon_path):
+                # PIL is only needed for the icon, import it only when there is one
+                from PIL import Image, ImageTk
                 icon = Image.open(icon_path)
                 photo = ImageTk.PhotoImage(icon)
                 self.wm_iconphoto(True, photo)
@@ -644,12 +1216,32 @@ class JobScraperApp(ctk.CTk):
         # Initialize scraper state
         self.scraper = None
         self.scraping_thread = None
+        self._done_event = threading.Event()  # Set by the scraper thread when it exits
+        self._poll_delay = 20  # Current delay in ms between completion checks
         self.is_scraping = False
         self.job_data = []
+        self._jobs_generation = 0  # Bumped when a load or scrape will replace job_data
+        self._last_progress_ts = 0.0  # Time of the last per-page progress update
+        self._pending_status = None  # Latest status waiting for the next flush
+        self._status_after = None  # Scheduled status flush, if any
+        self._status_q = queue.Queue()  # Status updates posted by background threads
+        self._ui_q = queue.Queue()  # Callbacks posted by background threads to run on the UI thread
+        self._export_pool = ThreadPoolExecutor(max_workers=1)  # Runs exports off the UI thread
+        self._last_dir = os.getcwd()  # Directory shown by the next file dialog
+        self._json_cache = OrderedDict()  # (path, mtime, size) -> parsed jobs, least recently used first
+        self._search_after_id = None  # Pending debounced search, if any
+        
+        # Background event loop for concurrent network work (e.g. salary evaluation)
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._loop_thread.start()
         
         # Create the UI components
         self.create_ui()
         
+        # Apply the status updates of background threads at most every 50ms
+        self.after(50, self._drain_ui_queue)
+        
         # Try to load the most recent job data if available
         self.try_load_recent_jobs()
         
@@ -930,11 +1522,11 @@ class JobScraperApp(ctk.CTk):
         )
         self.load_button.pack(fill="x", pady=(0, 8))
         
-        # Export to Excel button
+        # Export button
         self.export_button = ctk.CTkButton(
             button_frame, 
-            text="📊 Export to Excel",
-            command=self.export_to_excel,
+            text="📊 Export",
+            command=self.export_jobs,
             fg_color=("#8e44ad", "#5b2c6f"),  # Better shade of purple
             hover_color=("#7d3c98", "#4a235a"),
             corner_radius=10,
@@ -1058,29 +1650,27 @@ class JobScraperApp(ctk.CTk):
             self.jobs_frame.filter_jobs(date_filter=selected_option)
             
             # Count visible jobs to update result count
-            visible_count = sum(1 for frame in self.jobs_frame.job_frames if frame.winfo_viewable())
+            visible_count = len(self.jobs_frame.visible_jobs)
             self.results_label.configure(text=f"📋 Job Listings ({visible_count} filtered results)")
     
     def _on_search_changed(self, *args):
-        """Handle changes to the search bar."""
-        search_text = self.search_var.get()
-        self.jobs_frame.filter_jobs(text=search_text)
+        """Handle changes to the search bar, filtering once typing pauses."""
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+        self._search_after_id = self.after(SEARCH_DEBOUNCE_MS, self._apply_search)
+    
+    def _apply_search(self):
+        """Filter the job listings with the current search text."""
+        self._search_after_id = None
+        self.jobs_frame.filter_jobs(filter_text=self.search_var.get())
     
     def _on_sort_changed(self, selected_option):
         """Handle changes to the sort dropdown."""
-        # Map the user-friendly option to the corresponding job data field
-        sort_key_map = {
-            "Date": "scraped_date",
-            "Source": "source",
-            "Company": "company",
-            "Salary": "estimated_salary"
-        }
-        
         # Update the sort key in the jobs frame
-        self.jobs_frame.sort_key = sort_key_map.get(selected_option, "scraped_date")
+        self.jobs_frame.sort_key = _SORT_KEY_MAP.get(selected_option, "scraped_date")
         
-        # Re-sort and update the job listings
-        self.update_job_listings(self.job_data)
+        # Re-sort the job listings
+        self.jobs_frame.reorder(self.sort_jobs(self.job_data))
     
     def _evaluate_all_jobs(self):
         """Evaluate salaries for all jobs and then sort by estimated salary."""
@@ -1096,14 +1686,8 @@ class JobScraperApp(ctk.CTk):
         
         self.update_status("Evaluating all jobs...")
         
-        # Set evaluating flag
-        self.jobs_frame.evaluating_all = True
-        
         # Get all jobs that don't have salary estimates yet
-        jobs_to_evaluate = []
-        for frame in self.jobs_frame.job_frames:
-            if not frame.has_salary:
-                jobs_to_evaluate.append((frame.job_data, frame))
+        jobs_to_evaluate = [job for job in self.jobs_frame.jobs if 'estimated_salary' not in job]
         
         if not jobs_to_evaluate:
             self.update_status("All jobs already evaluated!")
@@ -1111,16 +1695,38 @@ class JobScraperApp(ctk.CTk):
             self._sort_by_salary()
             return
         
-        # Store remaining jobs to evaluate
-        self.jobs_frame.remaining_jobs = jobs_to_evaluate
+        # Set evaluating flag, cards built until the evaluation finishes start disabled
+        self.jobs_frame.evaluating_all = True
         
         # Disable all evaluate buttons to prevent multiple evaluations
         for frame in self.jobs_frame.job_frames:
-            if hasattr(frame, 'evaluate_button'):
-                frame.evaluate_button.configure(state="disabled")
+            frame.evaluate_button.configure(state="disabled")
+        
+        # Evaluate the jobs concurrently on the background event loop
+        asyncio.run_coroutine_threadsafe(self._evaluate_all_async(jobs_to_evaluate), self._loop)
+    
+    async def _evaluate_all_async(self, jobs_to_evaluate):
+        """Evaluate the salaries of the given jobs with bounded concurrency."""
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_EVALUATIONS)
+        total = len(jobs_to_evaluate)
+        completed = 0
+        
+        async def evaluate_one(job):
+            nonlocal completed
+            async with semaphore:
+                salary, currency = await evaluate_salary_async(job.get("title", ""), job.get("company", ""))
+            completed += 1
+            done = completed
+            
+            # Update UI in main thread
+            self._post_to_ui(self.jobs_frame._update_salary_display, job, salary, salary * 0.25, currency)
+            self._status_q.put((f"Evaluating all jobs... ({done}/{total})", True, done / total))
         
-        # Start evaluating the first job
-        self.jobs_frame._evaluate_next_job()
+        try:
+            await asyncio.gather(*(evaluate_one(job) for job in jobs_to_evaluate))
+        finally:
+            # Re-enable the buttons and sort by salary once every job has been evaluated
+            self._post_to_ui(self.jobs_frame._finish_evaluate_all)
     
     def _sort_by_salary(self):
         """Sort the job listings by estimated salary."""
@@ -1130,8 +1736,8 @@ class JobScraperApp(ctk.CTk):
         self.jobs_frame.sort_ascending = False  # Higher salaries first
         self.sort_order_var.set("↓")
         
-        # Re-sort and update the job listings
-        self.update_job_listings(self.job_data)
+        # Re-sort the job listings
+        self.jobs_frame.reorder(self.sort_jobs(self.job_data))
     
     def _toggle_sort_order(self):
         """Toggle between ascending and descending sort order."""
@@ -1140,8 +1746,8 @@ class JobScraperApp(ctk.CTk):
         # Update the button text to indicate sort direction
         self.sort_order_var.set("↑" if self.jobs_frame.sort_ascending else "↓")
         
-        # Re-sort and update the job listings
-        self.update_job_listings(self.job_data)
+        # Re-sort the job listings
+        self.jobs_frame.reorder(self.sort_jobs(self.job_data))
     
     def _toggle_collapsed_view(self):
         """Toggle between collapsed and expanded view for job listings."""
@@ -1149,83 +1755,143 @@ class JobScraperApp(ctk.CTk):
         self.jobs_frame.toggle_collapsed_view(collapsed)
     
     def update_status(self, message, is_progress=False, progress_value=None):
-        """Update the status bar with a message and optionally the progress bar."""
+        """Update the status bar with a message and optionally the progress bar.
+        
+        The update is shown by a flush scheduled at most 50ms later, so a burst
+        of updates redraws the status bar once, with the latest one.
+        """
+        # Statuses still queued by background threads are older than this one
+        self._discard_queued_status()
+        self._pending_status = (message, is_progress, progress_value)
+        if self._status_after is None:
+            self._status_after = self.after(50, self._flush_status)
+    
+    def _flush_status(self):
+        """Show the pending status, if any."""
+        self._status_after = None
+        pending, self._pending_status = self._pending_status, None
+        if pending is not None:
+            self._apply_status(*pending)
+    
+    def _discard_queued_status(self):
+        """Remove all pending status updates from the queue and return the latest one."""
+        latest = None
+        try:
+            while True:
+                latest = self._status_q.get_nowait()
+        except queue.Empty:
+            pass
+        return latest
+    
+    def _post_to_ui(self, callback, *args):
+        """Run callback(*args) on the UI thread, callable from any thread.
+        
+        Posted callbacks are run in batches by _drain_ui_queue instead of each
+        waking up the Tk event loop with its own after() call.
+        """
+        self._ui_q.put((callback, args))
+    
+    def _drain_ui_queue(self):
+        """Run the callbacks posted by background threads and apply only the
+        latest status they queued, then reschedule."""
+        try:
+            while True:
+                callback, args = self._ui_q.get_nowait()
+                try:
+                    callback(*args)
+                except Exception as e:
+                    logger.error(f"Error in UI callback: {str(e)}")
+        except queue.Empty:
+            pass
+        
+        latest = self._discard_queued_status()
+        if latest is not None:
+            # Queued statuses arrived after any pending one, which they replace
+            if self._status_after is not None:
+                self.after_cancel(self._status_after)
+            self._pending_status = latest
+            self._flush_status()
+        self.after(50, self._drain_ui_queue)
+    
+    def _apply_status(self, message, is_progress=False, progress_value=None):
+        """Show a message in the status bar and optionally update the progress bar."""
         self.status_label.configure(text=message)
         
         if is_progress and progress_value is not None:
             self.progress_bar.set(progress_value)
-        
-        # Force update of the UI
-        self.update_idletasks()
     
     def try_load_recent_jobs(self):
         """Try to load the most recent job data file if available."""
-        default_file = "real_estate_jobs_paris.json"
+        default_file = "real_estate_jobs_paris.jsonl"
+        legacy_file = "real_estate_jobs_paris.json"
+        if not os.path.exists(default_file):
+            default_file = legacy_file
         if os.path.exists(default_file):
-            try:
-                with open(default_file, 'r', encoding='utf-8') as f:
-                    jobs = json.load(f)
-                    self.job_data = jobs
-                    self.update_job_listings(jobs)
-                    self.update_status(f"Loaded {len(jobs)} jobs from {default_file}")
-            except Exception as e:
-                logger.error(f"Error loading recent jobs: {str(e)}")
-                self.update_status(f"Error loading recent jobs: {str(e)}")
+            self.update_status(f"Loading {default_file}...")
+            threading.Thread(
+                target=self._load_recent_jobs_file,
+                args=(default_file, default_file == legacy_file, self._jobs_generation),
+                daemon=True
+            ).start()
+    
+    def _load_recent_jobs_file(self, file_path, legacy, generation):
+        """Parse the most recent job data file, runs in a worker thread."""
+        try:
+            if legacy:
+                with open(file_path, 'rb') as f:
+                    jobs = _json_loads(f.read())
+            else:
+                jobs, _, _ = load_jobs_jsonl(file_path)
+        except Exception as e:
+            message = f"Error loading recent jobs: {str(e)}"
+            logger.error(message)
+            self._post_to_ui(self.update_status, message)
+            return
+        
+        self._post_to_ui(self._show_recent_jobs, jobs, file_path, generation)
+    
+    def _show_recent_jobs(self, jobs, file_path, generation):
+        """Display the startup jobs, unless a load or scrape started since then."""
+        if generation != self._jobs_generation:
+            logger.info(f"Discarding jobs from {file_path}, newer jobs were requested meanwhile")
+            return
+        self._show_loaded_jobs(jobs, file_path)
+    
+    def _show_loaded_jobs(self, jobs, file_path):
+        """Display jobs loaded from a file."""
+        self.job_data = jobs
+        self.update_job_listings(jobs)
+        self.update_status(f"Loaded {len(jobs)} jobs from {os.path.basename(file_path)}")
     
     def sort_jobs(self, jobs: List[Dict[str, Any]]):
         """Sort the job listings based on the current sort key and order."""
-        # Make a copy of the list to avoid modifying the original
-        sorted_jobs = jobs.copy()
-        
-        # Default value for missing keys
-        default_values = {
-            "scraped_date": "Unknown",
-            "source": "Unknown",
-            "company": "Unknown",
-            "estimated_salary": 0  # Default for estimated salary
-        }
+        sort_key = self.jobs_frame.sort_key
         
         # Special handling for different sort keys
-        if self.jobs_frame.sort_key == "scraped_date":
-            # Try to parse the date string, fallback to string comparison if parsing fails
-            def get_date_key(job):
-                date_str = job.get("scraped_date", default_values["scraped_date"])
-                try:
-                    return datetime.strptime(date_str, "%Y-%m-%d")
-                except (ValueError, TypeError):
-                    # If date format is different or parsing fails, use string
-                    return date_str
-            
-            key_func = get_date_key
-        elif self.jobs_frame.sort_key == "estimated_salary":
+        if sort_key == "scraped_date":
+            # Dates are stored as YYYY-MM-DD strings, which already sort chronologically,
+            # so compare the strings directly instead of parsing every date
+            key_func = lambda job: job.get("scraped_date") or "Unknown"
+        elif sort_key == "estimated_salary":
             # Sort by the estimated salary (numeric value)
-            key_func = lambda job: job.get("estimated_salary", default_values["estimated_salary"])
+            key_func = lambda job: job.get("estimated_salary", 0)
         else:
             # For other fields, use simple string comparison
-            sort_key = self.jobs_frame.sort_key
-            key_func = lambda job: job.get(sort_key, default_values.get(sort_key, "")).lower()
+            key_func = lambda job: job.get(sort_key, "Unknown").lower()
         
-        # Sort the jobs
-        sorted_jobs.sort(key=key_func, reverse=not self.jobs_frame.sort_ascending)
-        
-        return sorted_jobs
+        return sorted(jobs, key=key_func, reverse=not self.jobs_frame.sort_ascending)
         
     def update_job_listings(self, jobs: List[Dict[str, Any]]):
         """Update the job listings display with the provided job data."""
-        # Store reference to any jobs that had salary evaluations
-        evaluated_jobs = {}
-        for frame in self.jobs_frame.job_frames:
-            if hasattr(frame, 'has_salary') and frame.has_salary and hasattr(frame, 'job_data'):
-                # Use job title and company as a unique key
-                job_key = (frame.job_data.get('title', ''), frame.job_data.get('company', ''))
-                # Store the estimated salary and fee
-                evaluated_jobs[job_key] = {
-                    'estimated_salary': frame.job_data.get('estimated_salary', 0),
-                    'estimated_fee': frame.job_data.get('estimated_fee', 0)
-                }
-        
-        # Clear existing listings
-        self.jobs_frame.clear_jobs()
+        # Store the salary and fee of any jobs that had salary evaluations,
+        # keyed by job title and company
+        evaluated_jobs = {
+            (job.get('title', ''), job.get('company', '')): (
+                job.get('estimated_salary', 0),
+                job.get('estimated_fee', 0)
+            )
+            for job in self.jobs_frame.jobs if 'estimated_salary' in job
+        }
         
         # Update results count
         self.results_label.configure(text=f"Job Listings ({len(jobs)} results)")
@@ -1233,39 +1899,18 @@ class JobScraperApp(ctk.CTk):
         # Sort the jobs based on current sort key
         sorted_jobs = self.sort_jobs(jobs)
         
-        # Add each job to the scrollable frame and restore salary data if available
+        # Restore salary data of jobs that had a salary evaluation
         for job in sorted_jobs:
-            # Check if this job had salary evaluation
-            job_key = (job.get('title', ''), job.get('company', ''))
-            if job_key in evaluated_jobs:
-                # Restore the salary and fee data
-                job['estimated_salary'] = evaluated_jobs[job_key]['estimated_salary']
-                job['estimated_fee'] = evaluated_jobs[job_key]['estimated_fee']
-            
-            # Add the job to the frame
-            job_frame = self.jobs_frame.add_job(job)
-            
-            # If this job had salary data, trigger salary display
-            if job_key in evaluated_jobs and job_frame is not None:
-                # Access salary frame and update it
-                self.jobs_frame._update_salary_display(
-                    job_frame, 
-                    None,  # No progress label needed
-                    job['estimated_salary'],
-                    job['estimated_fee'],
-                    "EUR"
-                )
-            
-        # Apply collapsed view if enabled
-        if self.jobs_frame.collapsed_view:
-            self.jobs_frame.toggle_collapsed_view(True)
-            
-        # Apply current filters (both search text and date)
-        search_text = self.search_var.get()
-        date_filter = self.date_filter_var.get()
+            salary_data = evaluated_jobs.get((job.get('title', ''), job.get('company', '')))
+            if salary_data:
+                job['estimated_salary'], job['estimated_fee'] = salary_data
+        
+        # Apply current filters (both search text and date) without filtering yet,
+        # set_jobs filters and builds the frames of the first visible jobs once
+        self.jobs_frame.current_filter = self.search_var.get().lower()
+        self.jobs_frame.date_filter = self.date_filter_var.get()
         
-        # Apply both filters at once
-        self.jobs_frame.filter_jobs(filter_text=search_text, date_filter=date_filter)
+        self.jobs_frame.set_jobs(sorted_jobs)
     
     def start_scraping(self):
         """Start the job scraping process."""
@@ -1283,13 +1928,7 @@ class JobScraperApp(ctk.CTk):
         selected_date_filter = self.date_filter_var.get()
         if selected_date_filter != "Any time":
             # Convert UI date filter to scraper date filter format
-            date_filter_map = {
-                "Last 24 hours": "1day",
-                "Last week": "1week",
-                "Last 2 weeks": "2weeks",
-                "Last month": "1month"
-            }
-            date_filter = date_filter_map.get(selected_date_filter)
+            date_filter = _DATE_FILTER_MAP.get(selected_date_filter)
             logger.info(f"Using date filter: {date_filter}")
         
         # Check which sites to scrape
@@ -1315,6 +1954,7 @@ class JobScraperApp(ctk.CTk):
         
         # Update UI state for scraping
         self.is_scraping = True
+        self._jobs_generation += 1
         self.start_button.configure(state="disabled")
         self.stop_button.configure(state="normal")
         self.load_button.configure(state="disabled")
@@ -1322,63 +1962,38 @@ class JobScraperApp(ctk.CTk):
         # Update status
         self.update_status("Starting scraper...", is_progress=True, progress_value=0.05)
         
-        # Start scraping in a separate thread
+        # Start scraping in a daemon thread, so closing the window doesn't wait
+        # for a running scrape to finish
+        self._done_event = threading.Event()
         self.scraping_thread = threading.Thread(
             target=self._run_scraper, 
-            args=(query_fr, query_en, location, max_pages, sites_to_scrape, date_filter)
+            args=(query_fr, query_en, location, max_pages, sites_to_scrape, date_filter, self._done_event)
         )
         self.scraping_thread.daemon = True
         self.scraping_thread.start()
     
-    def _run_scraper(self, query_fr, query_en, location, max_pages, sites_to_scrape, date_filter=None):
-        """Run the scraper in a background thread to avoid blocking the UI."""
+    def _run_scraper(self, query_fr, query_en, location, max_pages, sites_to_scrape, date_filter=None,
+                     done_event=None):
+        """Run the scraper in a background thread to avoid blocking the UI.
+        
+        done_event is the event of this scrape, set when the thread exits. It is
+        passed in because self._done_event already belongs to the next scrape
+        if one was started before this thread finished.
+        """
         try:
-            # In a thread, we need to avoid using signals, but still use the real scraping functionality
-            import copy
+            # Create a counter for progress tracking
+            total_sites = sum(1 for enabled in sites_to_scrape.values() if enabled)
+            sites_completed = 0
             
-            # Create a thread-safe wrapper around the JobScraper class
-            # that removes signal handlers but keeps all the scraping functionality
-            class ThreadSafeJobScraper(JobScraper):
-                def __init__(self, **kwargs):
-                    # Initialize with parent class, but override signal setup
-                    # Call the parent's __init__ but capture and modify its behavior
-                    # Save original signal module functions
-                    import signal
-                    self._original_signal = signal.signal
-                    
-                    # Override signal.signal temporarily to prevent it from being used
-                    def dummy_signal(sig, handler):
-                        # Just log that we're skipping signal setup
-                        logging.debug(f"Skipping signal setup for {sig} in threaded context")
-                        return None
-                    
-                    # Replace signal.signal with our dummy version
-                    signal.signal = dummy_signal
-                    
-                    try:
-                        # Call parent constructor with the dummy signal handler
-                        super().__init__(**kwargs)
-                    finally:
-                        # Restore original signal.signal function
-                        signal.signal = self._original_signal
-                    
-                    # Set interrupted flag that we'll check instead of using signals
-                    self.interrupted = False
-                
-                # Override _handle_interrupt to avoid using signals
-                def _handle_interrupt(self, *args):
-                    logging.info("Scraper interrupted")
-                    self.interrupted = True
-                    
-                    # Still save progress when interrupted
-                    try:
-                        if self.jobs:
-                            filename = f"interrupted_scraper_{int(time.time())}.json"
-                            with open(filename, 'w', encoding='utf-8') as f:
-                                json.dump(self.jobs, f, ensure_ascii=False, indent=2)
-                            logging.info(f"Saved current progress to {filename}")
-                    except Exception as e:
-                        logging.error(f"Failed to save progress during interrupt: {str(e)}")
+            def on_page(site, page, total_pages):
+                # Throttle per-page updates so bursts of pages don't flood the Tk event queue
+                now = time.monotonic()
+                if now - self._last_progress_ts < 0.1:
+                    return
+                self._last_progress_ts = now
+                progress = (sites_completed + (page - 1) / total_pages) / total_sites
+                self._update_ui_status(f"Scraping {site} (page {page}/{total_pages}) in {location}...",
+                                      progress=progress)
             
             # Create our thread-safe scraper instance with the real scraping functionality
             self.scraper = ThreadSafeJobScraper(
@@ -1388,13 +2003,10 @@ class JobScraperApp(ctk.CTk):
                 timeout=30,
                 max_retries=3,
                 max_runtime=3600,  # 1 hour max runtime
-                date_filter=date_filter  # Pass the date filter to the scraper
+                date_filter=date_filter,  # Pass the date filter to the scraper
+                progress_callback=on_page
             )
             
-            # Create a counter for progress tracking
-            total_sites = sum(1 for enabled in sites_to_scrape.values() if enabled)
-            sites_completed = 0
-            
             # Run scraping operations based on selected sites
             if sites_to_scrape["indeed"] and not self.scraper.interrupted:
                 self._update_ui_status(f"Scraping Indeed for '{query_fr}' in {location}...", 
@@ -1420,35 +2032,64 @@ class JobScraperApp(ctk.CTk):
                 self.scraper.scrape_welcome_to_jungle(query=query_fr, location=location)
                 sites_completed += 1
             
-            # Save the results
-            self._update_ui_status("Saving results...", progress=0.95)
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             output_file = f"real_estate_jobs_{location.lower().replace(' ', '_')}_{timestamp}.json"
             
-            # First, save to the timestamped file directly
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(self.scraper.jobs, f, ensure_ascii=False, indent=2)
-                
-            # Then use save_to_json for the default file which handles proper merging with existing jobs
-            self.scraper.save_to_json(filename="real_estate_jobs_paris.json")
+            # Get the results and update UI right away, the results are saved in the background
+            scraper = self.scraper
+            jobs = scraper.jobs
+            self._update_ui_after_scraping(output_file, jobs)
             
-            # Get the results and update UI
-            self.job_data = self.scraper.jobs
-            self._update_ui_after_scraping(output_file)
+            # Give the scraper its own copies of the jobs so the UI can keep
+            # updating them (e.g. salary evaluation) while they are being written
+            scraper.jobs = [dict(job) for job in jobs]
+            threading.Thread(
+                target=self._persist_results,
+                args=(output_file, scraper),
+                daemon=True
+            ).start()
             
         except Exception as e:
             logger.error(f"Error during scraping: {str(e)}")
             self._update_ui_status(f"Error during scraping: {str(e)}", progress=0)
             self._update_ui_after_error()
+        finally:
+            if done_event is not None:
+                done_event.set()
+    
+    def _persist_results(self, output_file, scraper):
+        """Save the jobs of a finished scrape to disk in a background thread.
+        
+        The scraper is passed in rather than read from self.scraper, which a
+        new scrape replaces while this thread may still be running.
+        """
+        try:
+            # First, save to the timestamped file directly
+            with open(output_file, 'w', encoding='utf-8') as f:
+                json.dump(scraper.jobs, f, ensure_ascii=False, indent=2)
+                
+            # Then append the new jobs to the default archive
+            scraper.append_to_jsonl(filename="real_estate_jobs_paris.jsonl")
+            
+            self._post_to_ui(self.update_status, f"Saved to {output_file}")
+        except Exception as e:
+            message = f"Error saving results: {str(e)}"
+            logger.error(message)
+            self._post_to_ui(self.update_status, message)
     
     def _update_ui_status(self, message, progress=None):
         """Update the UI status from the background thread."""
         if self.is_scraping:
-            self.after(0, lambda: self.update_status(message, is_progress=True, progress_value=progress))
+            self._status_q.put((message, True, progress))
     
-    def _update_ui_after_scraping(self, output_file):
-        """Update the UI after scraping is complete."""
+    def _update_ui_after_scraping(self, output_file, jobs):
+        """Update the UI after scraping is complete.
+        
+        job_data is replaced on the UI thread, together with the displayed
+        list, so sorting never sees one without the other.
+        """
         def update():
+            self.job_data = jobs
             self.is_scraping = False
             self.start_button.configure(state="normal")
             self.stop_button.configure(state="disabled")
@@ -1459,12 +2100,12 @@ class JobScraperApp(ctk.CTk):
             
             # Update status with final message
             self.update_status(
-                f"Scraping completed. Found {len(self.job_data)} jobs. Saved to {output_file}",
+                f"Scraping completed. Found {len(self.job_data)} jobs. Saving to {output_file}...",
                 is_progress=True,
                 progress_value=1.0
             )
         
-        self.after(0, update)
+        self._post_to_ui(update)
     
     def _update_ui_after_error(self):
         """Update the UI after an error occurs."""
@@ -1475,7 +2116,7 @@ class JobScraperApp(ctk.CTk):
             self.load_button.configure(state="normal")
             self.progress_bar.set(0)
         
-        self.after(0, update)
+        self._post_to_ui(update)
     
     def stop_scraping(self):
         """Stop the ongoing scraping process."""
@@ -1484,13 +2125,15 @@ class JobScraperApp(ctk.CTk):
             self.scraper.interrupted = True
             
             # Wait for the thread to complete in a non-blocking way
-            self.after(100, self._check_thread_completion)
+            self._poll_delay = 20
+            self.after(self._poll_delay, self._check_thread_completion)
     
     def _check_thread_completion(self):
         """Check if the scraping thread has completed after stopping."""
-        if self.scraping_thread and self.scraping_thread.is_alive():
-            # Still running, check again in 100ms
-            self.after(100, self._check_thread_completion)
+        if not self._done_event.is_set() and self.scraping_thread and self.scraping_thread.is_alive():
+            # Still running, check again with a delay backing off from 20ms to 100ms
+            self._poll_delay = min(self._poll_delay * 2, 100)
+            self.after(self._poll_delay, self._check_thread_completion)
         else:
             # Thread has stopped
             self.is_scraping = False
@@ -1500,124 +2143,258 @@ class JobScraperApp(ctk.CTk):
             self.update_status("Scraper stopped by user", is_progress=True, progress_value=0)
     
     def load_results(self):
-        """Load job results from a JSON file."""
+        """Load job results from a JSON or JSON Lines file."""
         try:
             # Simple file dialog to choose a file
-            import tkinter.filedialog as filedialog
-            
             file_path = filedialog.askopenfilename(
                 title="Select Job Data File",
-                filetypes=[("JSON Files", "*.json"), ("All Files", "*.*")],
-                initialdir=os.getcwd()
+                filetypes=[("Job Data Files", "*.json *.jsonl"), ("JSON Files", "*.json"),
+                           ("JSON Lines Files", "*.jsonl"), ("All Files", "*.*")],
+                initialdir=self._last_dir
             )
             
             if file_path:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    jobs = json.load(f)
-                    self.job_data = jobs
-                    self.update_job_listings(jobs)
-                    self.update_status(f"Loaded {len(jobs)} jobs from {os.path.basename(file_path)}")
+                self._last_dir = os.path.dirname(file_path)
+                self._jobs_generation += 1
+                
+                # Reuse the parsed jobs if the file hasn't changed since it was last opened
+                stat = os.stat(file_path)
+                key = (file_path, stat.st_mtime_ns, stat.st_size)
+                cached = self._json_cache.get(key)
+                if cached is not None:
+                    self._json_cache.move_to_end(key)
+                    self._show_cached_jobs(cached, file_path)
+                    return
+                
+                # Parse the file off the UI thread
+                self.update_status(f"Loading {os.path.basename(file_path)}...")
+                threading.Thread(target=self._parse_results_file, args=(file_path, key), daemon=True).start()
         except Exception as e:
             logger.error(f"Error loading job data: {str(e)}")
             self.update_status(f"Error loading job data: {str(e)}")
     
-    def export_to_excel(self):
-        """Export job data to Excel format."""
+    def _parse_results_file(self, file_path, key):
+        """Parse a job results file, runs in a worker thread."""
+        try:
+            if file_path.lower().endswith('.jsonl'):
+                # JSON Lines archive, one job per line
+                jobs, _, _ = load_jobs_jsonl(file_path)
+            else:
+                # Read raw bytes, both parsers accept them and orjson skips the str decoding
+                with open(file_path, 'rb') as f:
+                    jobs = _json_loads(f.read())
+        except Exception as e:
+            message = f"Error loading job data: {str(e)}"
+            logger.error(message)
+            self._post_to_ui(self.update_status, message)
+            return
+        
+        self._post_to_ui(self._results_file_parsed, file_path, key, jobs)
+    
+    def _results_file_parsed(self, file_path, key, jobs):
+        """Cache and display the jobs parsed from a results file."""
+        self._json_cache[key] = jobs
+        while len(self._json_cache) > JSON_CACHE_SIZE:
+            self._json_cache.popitem(last=False)
+        self._show_cached_jobs(jobs, file_path)
+    
+    def _show_cached_jobs(self, cached, file_path):
+        """Display copies of cached jobs, salary evaluation updates the job dictionaries in place."""
+        self._show_loaded_jobs([dict(job) for job in cached], file_path)
+    
+    def export_jobs(self):
+        """Export job data to an Excel or CSV file."""
         try:
             # Check if we have job data to export
             if not self.job_data:
                 self.update_status("No job data to export. Please load or scrape jobs first.")
                 return
             
-            # Create a file dialog to select where to save the Excel file
-            import tkinter.filedialog as filedialog
-            
-            default_filename = f"job_listings_{datetime.now().strftime('%Y%m%d')}.xlsx"
+            # Create a file dialog to select where to save the file, large
+            # result sets default to CSV which skips all the Excel formatting
+            extension = ".csv" if len(self.job_data) > CSV_DEFAULT_MIN_ROWS else ".xlsx"
+            filetypes = [("Excel Files", "*.xlsx"), ("CSV Files", "*.csv")]
+            if extension == ".csv":
+                filetypes.reverse()
+            default_filename = f"job_listings_{datetime.now().strftime('%Y%m%d')}{extension}"
             file_path = filedialog.asksaveasfilename(
-                title="Save Excel File",
-                defaultextension=".xlsx",
-                filetypes=[("Excel Files", "*.xlsx"), ("All Files", "*.*")],
-                initialdir=os.getcwd(),
+                title="Save Export",
+                defaultextension=extension,
+                filetypes=filetypes + [("All Files", "*.*")],
+                initialdir=self._last_dir,
                 initialfile=default_filename
             )
             
             if not file_path:
                 # User cancelled the dialog
                 return
+            self._last_dir = os.path.dirname(file_path)
             
-            # Update status
-            self.update_status("Exporting to Excel...", is_progress=True, progress_value=0.2)
-            
-            # Convert job data to DataFrame
-            df = pd.DataFrame(self.job_data)
-            
-            # Ensure we have all expected columns, add empty ones if missing
-            expected_columns = ['title', 'company', 'location', 'description', 'url', 'source', 'scraped_date']
-            for col in expected_columns:
-                if col not in df.columns:
-                    df[col] = ""
+            # Very large exports can be split into several files instead of one huge workbook
+            split_files = False
+            if (len(self.job_data) > EXCEL_SHEET_ROWS * EXCEL_MAX_SHEETS
+                    and not file_path.lower().endswith(".csv")):
+                split_files = messagebox.askyesno(
+                    "Large Export",
+                    f"{len(self.job_data)} jobs need more than {EXCEL_MAX_SHEETS} sheets. "
+                    f"Save them as separate files of {EXCEL_SHEET_ROWS} jobs instead?"
+                )
             
-            # Reorder columns for better readability
-            ordered_columns = [
-                'title', 'company', 'location', 'source', 'scraped_date', 'description', 'url'
-            ]
-            # Only include columns that exist in the DataFrame
-            ordered_columns = [col for col in ordered_columns if col in df.columns]
-            # Add any additional columns that weren't in our expected list
-            remaining_columns = [col for col in df.columns if col not in ordered_columns]
-            final_columns = ordered_columns + remaining_columns
+            # Update status
+            self.update_status("Exporting...", is_progress=True, progress_value=0.2)
+            self.export_button.configure(state="disabled")
             
-            # Reorder the DataFrame columns
-            df = df[final_columns]
+            # Write the file in the export worker and handle the result back on the UI thread
+            future = self._export_pool.submit(self._do_export, file_path, list(self.job_data), split_files)
+            future.add_done_callback(functools.partial(self._post_to_ui, self._export_finished))
             
-            # Update progress
-            self.update_status("Formatting Excel file...", is_progress=True, progress_value=0.5)
+        except Exception as e:
+            logger.error(f"Error exporting jobs: {str(e)}")
+            self.update_status(f"Error exporting jobs: {str(e)}")
+            self.progress_bar.set(0)
+    
+    def _do_export(self, file_path, jobs, split_files=False):
+        """Write jobs to an Excel or CSV file, runs in the export worker thread.
+        
+        Jobs are split into sheets of at most EXCEL_SHEET_ROWS rows, or into
+        separate files of one sheet each when split_files is True. A path
+        ending in .csv is written as plain CSV instead.
+        
+        Args:
+            file_path: Path of the .xlsx or .csv file to create
+            jobs: Snapshot of the jobs to export, so scraping or loading can
+                replace self.job_data while the export runs
+            split_files: Write one file per sheet instead of a multi-sheet workbook
+        """
+        # Drop repeated listings, e.g. the same results file loaded after a
+        # scrape that already found those jobs. The rows are copies, the job
+        # dictionaries belong to the UI thread which keeps updating them.
+        seen = set()
+        rows = []
+        for job in jobs:
+            key = (job.get('title'), job.get('company'), job.get('url'))
+            if key not in seen:
+                seen.add(key)
+                row = dict(job)
+                for column in _INTERNED_COLUMNS:
+                    value = row.get(column)
+                    if isinstance(value, str):
+                        row[column] = sys.intern(value)
+                rows.append(row)
+        if len(rows) < len(jobs):
+            logger.info(f"Dropped {len(jobs) - len(rows)} duplicate jobs from the export")
+        jobs = rows
+        
+        # Expected columns, in the order that reads best, are always exported
+        ordered_columns = [
+            'title', 'company', 'location', 'source', 'scraped_date', 'description', 'url'
+        ]
+        # Add any additional columns that weren't in our expected list, in the
+        # order they first appear in the job data
+        all_columns = dict.fromkeys(key for job in jobs for key in job)
+        remaining_columns = [col for col in all_columns if col not in ordered_columns]
+        final_columns = ordered_columns + remaining_columns
+        
+        # CSV has no sheets, widths or styles, just dump the rows
+        if file_path.lower().endswith(".csv"):
+            _write_in_place(file_path, lambda path: _write_csv(
+                path, jobs, final_columns, lambda written, total: self._status_q.put(
+                    (f"Writing CSV rows {written}/{total}...", True, 0.5 + 0.5 * written / total))))
+            return len(jobs), os.path.basename(file_path)
+        
+        # Update progress
+        self._status_q.put(("Formatting Excel file...", True, 0.5))
+        
+        # Size the columns from the first jobs only, the widths are capped anyway
+        # and scanning every value of a large export costs more than it's worth
+        sample = jobs[:WIDTH_SAMPLE_ROWS]
+        column_widths = []
+        for column in final_columns:
+            # Long text columns like the description use a fixed width
+            fixed_width = _FIXED_COLUMN_WIDTHS.get(column)
+            if fixed_width is not None:
+                column_widths.append(fixed_width)
+                continue
             
-            # Export to Excel with nice formatting
-            with pd.ExcelWriter(file_path, engine='openpyxl') as writer:
-                df.to_excel(writer, index=False, sheet_name='Job Listings')
-                
-                # Get the worksheet to apply formatting
-                worksheet = writer.sheets['Job Listings']
-                
-                # Auto-adjust column widths based on content
-                for column in worksheet.columns:
-                    max_length = 0
-                    column_letter = column[0].column_letter
-                    
-                    # Skip description column as it can be very long
-                    if column[0].value == 'description':
-                        worksheet.column_dimensions[column_letter].width = 50
-                        continue
-                    
-                    for cell in column:
-                        if cell.value:
-                            max_length = max(max_length, len(str(cell.value)))
-                    
-                    # Set width with some padding
-                    adjusted_width = max(max_length + 2, 10)
-                    # Cap width to avoid excessively wide columns
-                    worksheet.column_dimensions[column_letter].width = min(adjusted_width, 40)
-                
-                # Format the header row
-                for cell in worksheet[1]:
-                    cell.font = writer.book.create_font(bold=True)
+            max_length = len(column)
+            for job in sample:
+                value = job.get(column)
+                if value:
+                    length = len(value) if isinstance(value, str) else len(str(value))
+                    if length > max_length:
+                        max_length = length
+                        # Any longer value ends up at the cap, stop measuring
+                        if max_length >= MAX_COLUMN_WIDTH - 2:
+                            break
             
-            # Update status with completion message
-            self.update_status(
-                f"Successfully exported {len(self.job_data)} jobs to {os.path.basename(file_path)}",
-                is_progress=True,
-                progress_value=1.0
-            )
+            # Set width with some padding
+            adjusted_width = max(max_length + 2, 10)
+            # Cap width to avoid excessively wide columns
+            column_widths.append(min(adjusted_width, MAX_COLUMN_WIDTH))
+        
+        if len(jobs) > DIRECT_XML_MIN_ROWS:
+            write_xlsx = _write_xlsx_direct
+        elif xlsxwriter is not None:
+            write_xlsx = _write_xlsx_xlsxwriter
+        else:
+            write_xlsx = _write_xlsx_openpyxl
+        segments = [jobs[start:start + EXCEL_SHEET_ROWS]
+                    for start in range(0, len(jobs), EXCEL_SHEET_ROWS)]
+        
+        def report_progress(written, total):
+            self._status_q.put((f"Writing Excel rows {written}/{total}...", True, 0.5 + 0.5 * written / total))
+        
+        if split_files:
+            root, extension = os.path.splitext(file_path)
+            offset = 0
+            for index, segment in enumerate(segments, 1):
+                _write_in_place(f"{root}_part{index}{extension}", functools.partial(
+                    write_xlsx, segments=[segment], columns=final_columns, widths=column_widths,
+                    progress_callback=lambda written, _, offset=offset: report_progress(offset + written, len(jobs))
+                ))
+                offset += len(segment)
+            destination = f"{len(segments)} files"
+        elif len(jobs) < EXPORT_BUFFER_MAX_ROWS:
+            # The writers make many small writes while zipping, collect them in
+            # memory and hand the finished file to the disk in a single write
+            buffer = io.BytesIO()
+            write_xlsx(buffer, segments, final_columns, column_widths, report_progress)
             
-            # Reset progress bar after a delay
-            self.after(3000, lambda: self.progress_bar.set(0))
+            def write_buffer(path):
+                with open(path, 'wb') as f:
+                    f.write(buffer.getbuffer())
             
+            _write_in_place(file_path, write_buffer)
+            destination = os.path.basename(file_path)
+        else:
+            _write_in_place(file_path, functools.partial(
+                write_xlsx, segments=segments, columns=final_columns, widths=column_widths,
+                progress_callback=report_progress
+            ))
+            destination = os.path.basename(file_path)
+        
+        return len(jobs), destination
+    
+    def _export_finished(self, future):
+        """Report the result of an export once the worker is done."""
+        self.export_button.configure(state="normal")
+        try:
+            exported_count, destination = future.result()
         except Exception as e:
-            logger.error(f"Error exporting to Excel: {str(e)}")
-            self.update_status(f"Error exporting to Excel: {str(e)}")
+            logger.error(f"Error exporting jobs: {str(e)}")
+            self.update_status(f"Error exporting jobs: {str(e)}")
             self.progress_bar.set(0)
-
+            return
+        
+        # Update status with completion message
+        self.update_status(
+            f"Successfully exported {exported_count} jobs to {destination}",
+            is_progress=True,
+            progress_value=1.0
+        )
+        
+        # Reset progress bar after a delay
+        self.after(3000, self.progress_bar.set, 0)
 
 if __name__ == "__main__":
     app = JobScraperApp()